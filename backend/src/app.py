@@ -7,22 +7,42 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import csv
+import functools
+import io
 import json
 import os
 import sys
+import traceback
+from collections import Counter
 from typing import Dict, Any, List, Optional
 import boto3
 
 # Add src to path for Lambda
 sys.path.insert(0, os.path.dirname(__file__))
 
-from utils.response import success_response, error_response, cors_preflight
+from utils.response import success_response, error_response, cors_preflight, CORS_HEADERS
 from utils.auth import extract_groups_from_claims, can_access_service
 from utils.aws_client import client_manager, AWSClientManager
 from utils.dynamodb_storage import storage
 from collectors import COLLECTORS
 
 
+# Columns placed first in CSV exports
+CSV_PRIORITY_KEYS = ('accountId', 'region')
+
+# Resource states/statuses counted by /summary
+RUNNING_STATES = frozenset({'running', 'available', 'active'})
+STOPPED_STATES = frozenset({'stopped', 'stopping'})
+ERROR_STATUSES = frozenset({'error', 'failed'})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lambda_client():
+    """Lambda client for invoking the refresh function (created once per container)"""
+    return boto3.client('lambda')
+
+
 def get_regions_from_params(params: Dict[str, Any], service: Optional[str] = None) -> List[str]:
     """
     Parse regions from query parameters
@@ -34,21 +54,21 @@ def get_regions_from_params(params: Dict[str, Any], service: Optional[str] = Non
     Returns:
         List of regions to query
     """
-    # IAM is global - only need one region (us-east-1) for IAM client
-    if service and service.lower() == 'iam':
-        return ['us-east-1']  # IAM endpoint is in us-east-1
+    # Global services (e.g. IAM) - only need one region (us-east-1)
+    if service and service.lower() in AWSClientManager.GLOBAL_SERVICES:
+        return ['us-east-1']  # Global endpoints are in us-east-1
     
     regions_param = params.get('regions', '')
     if regions_param:
         regions = [r.strip() for r in regions_param.split(',') if r.strip()]
         # Validate regions
-        valid_regions = [r for r in regions if r in AWSClientManager.AWS_REGIONS]
+        valid_regions = [r for r in regions if r in AWSClientManager.AWS_REGIONS_SET]
         if valid_regions:
             return valid_regions
     
     # Default to all regions if no specific region requested
     # This allows querying all regions when none specified
-    return AWSClientManager.AWS_REGIONS
+    return list(AWSClientManager.AWS_REGIONS)
 
 
 def get_accounts_from_params(params: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -91,8 +111,7 @@ def collect_inventory(
     if service not in COLLECTORS:
         raise ValueError(f"Unsupported service: {service}")
     
-    collector_class = COLLECTORS[service]
-    collector = collector_class()
+    collector = COLLECTORS[service]
     
     # Get account IDs from accounts list, or None to get all
     account_ids = None
@@ -118,6 +137,41 @@ def collect_inventory(
         return []
 
 
+def find_resource(
+    resources: List[Dict[str, Any]],
+    resource_id: str,
+    id_fields: tuple[str, ...]
+) -> Optional[Dict[str, Any]]:
+    """Find the first resource whose identifier fields match resource_id"""
+    return next(
+        (r for r in resources if any(r.get(field) == resource_id for field in id_fields)),
+        None
+    )
+
+
+def flatten_dict(d: Dict[str, Any], sep: str = '_') -> Dict[str, Any]:
+    """
+    Flatten nested dictionaries and arrays for CSV export
+    
+    Nested keys are joined with sep and lists become comma-separated strings.
+    Uses an explicit stack so deeply nested resources don't recurse.
+    """
+    flat: Dict[str, Any] = {}
+    stack = [('', d)]
+    while stack:
+        parent_key, current = stack.pop()
+        for k, v in current.items():
+            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+            if isinstance(v, dict):
+                stack.append((new_key, v))
+            elif isinstance(v, list):
+                # Convert list to comma-separated string
+                flat[new_key] = ','.join(str(item) for item in v)
+            else:
+                flat[new_key] = v
+    return flat
+
+
 def validate_service(service: str) -> bool:
     """Validate service name"""
     if not service or not isinstance(service, str):
@@ -185,8 +239,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             # This endpoint will invoke the refresh Lambda function
             # For now, return a message indicating refresh was triggered
             try:
-                import boto3
-                lambda_client = boto3.client('lambda')
+                lambda_client = _get_lambda_client()
                 refresh_function_name = os.environ.get('REFRESH_FUNCTION_NAME', 'aws-inventory-dashboard-RefreshFunction')
                 
                 # Invoke refresh function asynchronously
@@ -235,11 +288,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             try:
                 resources = collect_inventory(service, regions, accounts)
                 
-                # Calculate summary
+                # Calculate summary from state/status histograms
                 total = len(resources)
-                running = sum(1 for r in resources if r.get('state', '').lower() in ['running', 'available', 'active'])
-                stopped = sum(1 for r in resources if r.get('state', '').lower() in ['stopped', 'stopping'])
-                errors = sum(1 for r in resources if r.get('status', '').lower() in ['error', 'failed'])
+                states = Counter((r.get('state') or '').lower() for r in resources)
+                statuses = Counter((r.get('status') or '').lower() for r in resources)
+                running = sum(states[s] for s in RUNNING_STATES)
+                stopped = sum(states[s] for s in STOPPED_STATES)
+                errors = sum(statuses[s] for s in ERROR_STATUSES)
                 
                 # Security issues
                 security_issues = 0
@@ -259,9 +314,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 return error_response("Invalid request parameters", 400, str(e), error_code="VALIDATION_ERROR")
             except Exception as e:
                 print(f"[{request_id}] Error getting summary: {str(e)}")
-                import traceback
                 traceback.print_exc()
-                return error_response("Failed to get summary", 500, str(e) if os.environ.get("ENVIRONMENT") != "prod" else None, error_code="INTERNAL_ERROR")
+                return error_response("Failed to get summary", 500, str(e), error_code="INTERNAL_ERROR")
         
         if path.endswith("/export"):
             # Export functionality
@@ -282,43 +336,25 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 if export_format == "csv":
                     # Generate CSV with flattened nested data
                     if not resources:
-                        csv = "No data"
+                        csv_body = "No data"
                     else:
-                        import csv as csv_module
-                        import io
-                        from utils.response import CORS_HEADERS
-                        
-                        # Flatten nested dictionaries and arrays for CSV
-                        def flatten_dict(d, parent_key='', sep='_'):
-                            items = []
-                            for k, v in d.items():
-                                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                                if isinstance(v, dict):
-                                    items.extend(flatten_dict(v, new_key, sep=sep).items())
-                                elif isinstance(v, list):
-                                    # Convert list to comma-separated string
-                                    items.append((new_key, ','.join(str(item) for item in v)))
-                                else:
-                                    items.append((new_key, v))
-                            return dict(items)
-                        
-                        flattened_resources = [flatten_dict(r) for r in resources]
-                        
-                        # Get all unique keys
+                        # Flatten and collect all unique keys in a single pass
+                        flattened_resources = []
                         all_keys = set()
-                        for r in flattened_resources:
-                            all_keys.update(r.keys())
+                        for r in resources:
+                            flat = flatten_dict(r)
+                            all_keys.update(flat)
+                            flattened_resources.append(flat)
                         
                         # Prioritize region and accountId columns (put them first)
-                        priority_keys = ['accountId', 'region']
-                        other_keys = sorted([k for k in all_keys if k not in priority_keys])
-                        fieldnames = [k for k in priority_keys if k in all_keys] + other_keys
+                        other_keys = sorted(all_keys.difference(CSV_PRIORITY_KEYS))
+                        fieldnames = [k for k in CSV_PRIORITY_KEYS if k in all_keys] + other_keys
                         
                         output = io.StringIO()
-                        writer = csv_module.DictWriter(output, fieldnames=fieldnames)
+                        writer = csv.DictWriter(output, fieldnames=fieldnames)
                         writer.writeheader()
                         writer.writerows(flattened_resources)
-                        csv = output.getvalue()
+                        csv_body = output.getvalue()
                     
                     return {
                         "statusCode": 200,
@@ -327,7 +363,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                             "Content-Type": "text/csv",
                             "Content-Disposition": f'attachment; filename="{service}_inventory.csv"'
                         },
-                        "body": csv
+                        "body": csv_body
                     }
                 else:
                     # JSON export
@@ -340,9 +376,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 return error_response("Invalid request parameters", 400, str(e), error_code="VALIDATION_ERROR")
             except Exception as e:
                 print(f"[{request_id}] Error exporting: {str(e)}")
-                import traceback
                 traceback.print_exc()
-                return error_response("Export failed", 500, str(e) if os.environ.get("ENVIRONMENT") != "prod" else None, error_code="EXPORT_ERROR")
+                return error_response("Export failed", 500, str(e), error_code="EXPORT_ERROR")
         
         if path.endswith("/details"):
             # Resource detail endpoint
@@ -362,19 +397,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 # Collect inventory and find the specific resource
                 resources = collect_inventory(service, regions, accounts)
                 
-                # Find resource by ID (check various ID fields)
-                resource = None
-                for r in resources:
-                    if (r.get('id') == resource_id or 
-                        r.get('instance_id') == resource_id or
-                        r.get('bucket_name') == resource_id or
-                        r.get('table_name') == resource_id or
-                        r.get('role_name') == resource_id or
-                        r.get('vpc_id') == resource_id or
-                        r.get('cluster_name') == resource_id or
-                        r.get('db_identifier') == resource_id):
-                        resource = r
-                        break
+                # Find resource by ID (only the fields this service's collector uses)
+                resource = find_resource(resources, resource_id, COLLECTORS[service].ID_FIELDS)
                 
                 if not resource:
                     return error_response("Resource not found", 404)
@@ -432,15 +456,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return error_response("Invalid service or parameters", 400, str(e), error_code="VALIDATION_ERROR")
         except Exception as e:
             print(f"[{request_id}] ERROR collecting {service} inventory: {str(e)}")
-            import traceback
             traceback.print_exc()
-            error_details = str(e) if os.environ.get("ENVIRONMENT") != "prod" else None
-            return error_response(f"Failed to collect {service} inventory", 500, error_details, error_code="COLLECTION_ERROR")
+            return error_response(f"Failed to collect {service} inventory", 500, str(e), error_code="COLLECTION_ERROR")
     except ValueError as e:
         return error_response("Invalid request", 400, str(e), error_code="VALIDATION_ERROR")
     except Exception as e:
         print(f"[{request_id}] ERROR in lambda_handler: {str(e)}")
-        import traceback
         traceback.print_exc()
-        error_details = str(e) if os.environ.get("ENVIRONMENT") != "prod" else None
-        return error_response("Internal server error", 500, error_details, error_code="INTERNAL_ERROR")
+        return error_response("Internal server error", 500, str(e), error_code="INTERNAL_ERROR")
@@ -15,15 +15,15 @@ from .rds_collector import RDSCollector
 from .dynamodb_collector import DynamoDBCollector
 from .iam_collector import IAMCollector
 
-# Collector registry
+# Collector registry - collectors are stateless, so one instance per container is shared
 COLLECTORS = {
-    'ec2': EC2Collector,
-    'vpc': VPCCollector,
-    'eks': EKSCollector,
-    'ecs': ECSCollector,
-    's3': S3Collector,
-    'rds': RDSCollector,
-    'dynamodb': DynamoDBCollector,
-    'iam': IAMCollector,
+    'ec2': EC2Collector(),
+    'vpc': VPCCollector(),
+    'eks': EKSCollector(),
+    'ecs': ECSCollector(),
+    's3': S3Collector(),
+    'rds': RDSCollector(),
+    'dynamodb': DynamoDBCollector(),
+    'iam': IAMCollector(),
 }
 
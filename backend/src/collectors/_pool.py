@@ -0,0 +1,21 @@
+"""
+Shared thread pools for collectors
+
+Python 3.12+ compatible, forward-compatible with Python 3.14+
+"""
+
+from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Region fan-out pool used by BaseCollector.collect_multi_region (one task per region)
+REGION_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix='collector-region')
+
+# Per-resource API calls made from inside collect_single_region. Kept separate from
+# REGION_EXECUTOR: region tasks block on this pool, so sharing one pool could deadlock.
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv('COLLECTOR_THREADS', '32')),
+    thread_name_prefix='collector-call'
+)
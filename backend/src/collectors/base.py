@@ -6,14 +6,42 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import json
+from typing import List, Dict, Any, Optional, Iterator
+from concurrent.futures import as_completed
+from ._pool import REGION_EXECUTOR
+
+
+logger = logging.getLogger(__name__)
+
+
+def _iter_leaves(value: Any) -> Iterator[str]:
+    """Lazily yield every leaf value nested in a resource as a string"""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            yield current
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+        else:
+            yield str(current)
 
 
 class BaseCollector(ABC):
-    """Base class for AWS service collectors"""
+    """
+    Base class for AWS service collectors
+    
+    Collectors issue many concurrent calls on the client they are given, so
+    clients should come from AWSClientManager.get_client, which applies the
+    shared CLIENT_CONFIG (TCP keep-alive, 50 pooled connections, adaptive retries).
+    """
+    
+    # Resource fields that hold the resource's identifier (used by /details lookups)
+    ID_FIELDS: tuple[str, ...] = ('id',)
     
     def __init__(self, service_name: str):
         self.service_name = service_name
@@ -42,8 +70,7 @@ class BaseCollector(ABC):
         self,
         clients: Dict[str, Any],
         regions: List[str],
-        account_id: Optional[str] = None,
-        max_workers: int = 10
+        account_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Collect resources from multiple regions in parallel
@@ -52,7 +79,6 @@ class BaseCollector(ABC):
             clients: Dict mapping region -> client
             regions: List of regions to collect from
             account_id: Account ID (for multi-account)
-            max_workers: Maximum parallel workers
             
         Returns:
             Combined list of resources from all regions
@@ -61,49 +87,31 @@ class BaseCollector(ABC):
         
         # If no clients available, return empty list
         if not clients:
-            print(f"Warning: No clients available for {self.service_name}")
+            logger.warning("No clients available for %s", self.service_name)
             return all_resources
         
-        # For IAM (global service), only process one region
-        if self.service_name == 'iam' and clients:
-            # IAM is global, use the first available client
-            region = list(clients.keys())[0]
-            client = clients[region]
+        # Collect from all regions in parallel on the shared pool
+        futures = {
+            REGION_EXECUTOR.submit(self.collect_single_region, clients[region], region, account_id): region
+            for region in regions
+            if region in clients
+        }
+        
+        for future in as_completed(futures):
+            region = futures[future]
             try:
-                resources = self.collect_single_region(client, 'global', account_id)
-                # Ensure account_id is present
+                resources = future.result()
+                # Ensure region and account_id are present in each resource
                 for resource in resources:
+                    # Always set region (overwrite if already set)
+                    resource['region'] = region
+                    # Always set accountId if account_id is provided
                     if account_id:
                         resource['accountId'] = account_id
-                    # IAM resources already have region='global' set
                 all_resources.extend(resources)
-            except Exception as e:
-                print(f"Error collecting {self.service_name}: {str(e)}")
-            return all_resources
-        
-        # For regional services, collect from all regions in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.collect_single_region, clients[region], region, account_id): region
-                for region in regions
-                if region in clients
-            }
-            
-            for future in as_completed(futures):
-                region = futures[future]
-                try:
-                    resources = future.result()
-                    # Ensure region and account_id are present in each resource
-                    for resource in resources:
-                        # Always set region (overwrite if already set)
-                        resource['region'] = region
-                        # Always set accountId if account_id is provided
-                        if account_id:
-                            resource['accountId'] = account_id
-                    all_resources.extend(resources)
-                except Exception as e:
-                    print(f"Error collecting {self.service_name} from {region}: {str(e)}")
-                    # Continue with other regions even if one fails
+            except Exception:
+                logger.exception("Error collecting %s from %s", self.service_name, region)
+                # Continue with other regions even if one fails
         
         return all_resources
     
@@ -126,15 +134,12 @@ class BaseCollector(ABC):
             return resources
         
         search_lower = search_term.lower()
-        filtered = []
-        
-        for resource in resources:
-            # Convert resource to JSON string for searching
-            resource_str = json.dumps(resource, default=str).lower()
-            if search_lower in resource_str:
-                filtered.append(resource)
         
-        return filtered
+        # Walk values directly and stop at the first match instead of serializing each resource
+        return [
+            resource for resource in resources
+            if any(search_lower in leaf.lower() for leaf in _iter_leaves(resource))
+        ]
     
     def paginate_results(
         self,
@@ -6,13 +6,20 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import logging
 from typing import List, Dict, Any, Optional
 from .base import BaseCollector
+from ._pool import EXECUTOR
+
+
+logger = logging.getLogger(__name__)
 
 
 class DynamoDBCollector(BaseCollector):
     """Collects DynamoDB tables"""
     
+    ID_FIELDS = ('id', 'table_name')
+    
     def __init__(self):
         super().__init__('dynamodb')
     
@@ -32,13 +39,16 @@ class DynamoDBCollector(BaseCollector):
             for page in paginator.paginate():
                 table_names.extend(page.get('TableNames', []))
             
-            # Describe tables individually (DynamoDB doesn't support batch describe)
-            for table_name in table_names:
+            if not table_names:
+                return items
+            
+            # DynamoDB doesn't support batch describe - describe tables in parallel instead
+            def describe(table_name: str) -> Optional[Dict[str, Any]]:
                 try:
                     table_response = client.describe_table(TableName=table_name)
                     table = table_response['Table']
                     
-                    items.append({
+                    return {
                         'id': table['TableArn'],
                         'table_name': table['TableName'],
                         'name': table['TableName'],
@@ -47,12 +57,14 @@ class DynamoDBCollector(BaseCollector):
                         'item_count': table.get('ItemCount', 0),
                         'created_at': table.get('CreationDateTime').isoformat() if table.get('CreationDateTime') else None,
                         'region': region
-                    })
-                except Exception as e:
-                    print(f"Error describing DynamoDB table {table_name}: {str(e)}")
-                    continue
-        except Exception as e:
-            print(f"Error collecting DynamoDB tables from {region}: {str(e)}")
+                    }
+                except Exception:
+                    logger.exception("Error describing DynamoDB table %s", table_name)
+                    return None
+            
+            items.extend(table for table in EXECUTOR.map(describe, table_names) if table)
+        except Exception:
+            logger.exception("Error collecting DynamoDB tables from %s", region)
         
         return items
 
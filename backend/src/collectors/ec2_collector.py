@@ -6,13 +6,24 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import logging
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from .base import BaseCollector
+from .utils import normalize_tags
+
+
+logger = logging.getLogger(__name__)
+
+# Fields every DescribeInstances instance carries, fetched in one C-level call
+_INSTANCE_FIELDS = itemgetter('InstanceId', 'InstanceType', 'State')
 
 
 class EC2Collector(BaseCollector):
     """Collects EC2 instances"""
     
+    ID_FIELDS = ('id', 'instance_id')
+    
     def __init__(self):
         super().__init__('ec2')
     
@@ -24,34 +35,38 @@ class EC2Collector(BaseCollector):
     ) -> List[Dict[str, Any]]:
         """Collect EC2 instances from a region"""
         items = []
+        append = items.append
         
         try:
             paginator = client.get_paginator('describe_instances')
             
-            for page in paginator.paginate():
+            # Request the API maximum per page (1000) to minimize round-trips
+            for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
                 for reservation in page['Reservations']:
                     for instance in reservation['Instances']:
-                        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
+                        # Bind the lookup once; this loop runs for every instance in the fleet
+                        get = instance.get
+                        instance_id, instance_type, state = _INSTANCE_FIELDS(instance)
+                        tags = normalize_tags(get('Tags'))
+                        launch_time = get('LaunchTime')
                         
-                        items.append({
-                            'id': instance['InstanceId'],
-                            'instance_id': instance['InstanceId'],
+                        append({
+                            'id': instance_id,
+                            'instance_id': instance_id,
                             'name': tags.get('Name', ''),
-                            'state': instance['State']['Name'],
-                            'instance_type': instance['InstanceType'],
-                            'private_ip': instance.get('PrivateIpAddress'),
-                            'public_ip': instance.get('PublicIpAddress'),
-                            'security_groups': [
-                                sg['GroupName'] for sg in instance.get('SecurityGroups', [])
-                            ],
-                            'vpc_id': instance.get('VpcId'),
-                            'subnet_id': instance.get('SubnetId'),
-                            'launch_time': instance.get('LaunchTime').isoformat() if instance.get('LaunchTime') else None,
+                            'state': state['Name'],
+                            'instance_type': instance_type,
+                            'private_ip': get('PrivateIpAddress'),
+                            'public_ip': get('PublicIpAddress'),
+                            'security_groups': [sg['GroupName'] for sg in get('SecurityGroups', ())],
+                            'vpc_id': get('VpcId'),
+                            'subnet_id': get('SubnetId'),
+                            'launch_time': launch_time.isoformat() if launch_time else None,
                             'tags': tags,
                             'region': region
                         })
-        except Exception as e:
-            print(f"Error collecting EC2 instances from {region}: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting EC2 instances from %s", region)
         
         return items
 
@@ -6,13 +6,20 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import logging
 from typing import List, Dict, Any, Optional
 from .base import BaseCollector
+from ._pool import EXECUTOR
+
+
+logger = logging.getLogger(__name__)
 
 
 class ECSCollector(BaseCollector):
     """Collects ECS clusters"""
     
+    ID_FIELDS = ('id', 'cluster_name')
+    
     def __init__(self):
         super().__init__('ecs')
     
@@ -25,45 +32,41 @@ class ECSCollector(BaseCollector):
         """Collect ECS clusters from a region"""
         items = []
         
+        def describe_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            try:
+                return client.describe_clusters(clusters=batch, include=['STATISTICS'])['clusters']
+            except Exception:
+                logger.exception("Error describing ECS clusters in %s", region)
+                return []
+        
         try:
+            cluster_arns = []
             paginator = client.get_paginator('list_clusters')
-            
             for page in paginator.paginate():
-                cluster_arns = page.get('clusterArns', [])
-                
-                if not cluster_arns:
-                    continue
-                
-                # Describe clusters in batches
-                for i in range(0, len(cluster_arns), 10):
-                    batch = cluster_arns[i:i+10]
-                    try:
-                        clusters_response = client.describe_clusters(clusters=batch)
-                        
-                        for cluster in clusters_response['clusters']:
-                            # Get services and tasks
-                            services_response = client.list_services(cluster=cluster['clusterName'])
-                            services = services_response.get('serviceArns', [])
-                            
-                            tasks_response = client.list_tasks(cluster=cluster['clusterName'], desiredStatus='RUNNING')
-                            running_tasks = len(tasks_response.get('taskArns', []))
-                            
-                            items.append({
-                                'id': cluster['clusterArn'],
-                                'cluster_name': cluster['clusterName'],
-                                'name': cluster['clusterName'],
-                                'status': cluster['status'],
-                                'active_services': len(services),
-                                'running_tasks': running_tasks,
-                                'registered_container_instances': cluster.get('registeredContainerInstancesCount', 0),
-                                'created_at': cluster.get('createdAt').isoformat() if cluster.get('createdAt') else None,
-                                'region': region
-                            })
-                    except Exception as e:
-                        print(f"Error describing ECS clusters: {str(e)}")
-                        continue
-        except Exception as e:
-            print(f"Error collecting ECS clusters from {region}: {str(e)}")
+                cluster_arns.extend(page.get('clusterArns', []))
+            
+            if not cluster_arns:
+                return items
+            
+            # Describe clusters in batches of 10, all batches in parallel. The
+            # describe response already carries service/task counts, so no
+            # per-cluster list calls are needed.
+            batches = [cluster_arns[i:i+10] for i in range(0, len(cluster_arns), 10)]
+            for clusters in EXECUTOR.map(describe_batch, batches):
+                for cluster in clusters:
+                    items.append({
+                        'id': cluster['clusterArn'],
+                        'cluster_name': cluster['clusterName'],
+                        'name': cluster['clusterName'],
+                        'status': cluster['status'],
+                        'active_services': cluster.get('activeServicesCount', 0),
+                        'running_tasks': cluster.get('runningTasksCount', 0),
+                        'registered_container_instances': cluster.get('registeredContainerInstancesCount', 0),
+                        'created_at': cluster.get('createdAt').isoformat() if cluster.get('createdAt') else None,
+                        'region': region
+                    })
+        except Exception:
+            logger.exception("Error collecting ECS clusters from %s", region)
         
         return items
 
@@ -6,13 +6,21 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import logging
 from typing import List, Dict, Any, Optional
+from concurrent.futures import as_completed
 from .base import BaseCollector
+from ._pool import EXECUTOR
+
+
+logger = logging.getLogger(__name__)
 
 
 class EKSCollector(BaseCollector):
     """Collects EKS clusters"""
     
+    ID_FIELDS = ('id', 'cluster_name')
+    
     def __init__(self):
         super().__init__('eks')
     
@@ -25,37 +33,42 @@ class EKSCollector(BaseCollector):
         """Collect EKS clusters from a region"""
         items = []
         
+        def fetch_cluster(cluster_name: str) -> Dict[str, Any]:
+            cluster_response = client.describe_cluster(name=cluster_name)
+            cluster = cluster_response['cluster']
+            
+            # Get node groups
+            node_groups_response = client.list_nodegroups(clusterName=cluster_name)
+            node_groups = node_groups_response.get('nodegroups', [])
+            
+            return {
+                'id': cluster['arn'],
+                'cluster_name': cluster['name'],
+                'name': cluster['name'],
+                'status': cluster['status'],
+                'version': cluster.get('version', ''),
+                'endpoint': cluster.get('endpoint', ''),
+                'node_groups': node_groups,
+                'created_at': cluster.get('createdAt').isoformat() if cluster.get('createdAt') else None,
+                'region': region
+            }
+        
         try:
+            cluster_names = []
             paginator = client.get_paginator('list_clusters')
-            
             for page in paginator.paginate():
-                cluster_names = page.get('clusters', [])
-                
-                for cluster_name in cluster_names:
-                    try:
-                        cluster_response = client.describe_cluster(name=cluster_name)
-                        cluster = cluster_response['cluster']
-                        
-                        # Get node groups
-                        node_groups_response = client.list_nodegroups(clusterName=cluster_name)
-                        node_groups = node_groups_response.get('nodegroups', [])
-                        
-                        items.append({
-                            'id': cluster['arn'],
-                            'cluster_name': cluster['name'],
-                            'name': cluster['name'],
-                            'status': cluster['status'],
-                            'version': cluster.get('version', ''),
-                            'endpoint': cluster.get('endpoint', ''),
-                            'node_groups': node_groups,
-                            'created_at': cluster.get('createdAt').isoformat() if cluster.get('createdAt') else None,
-                            'region': region
-                        })
-                    except Exception as e:
-                        print(f"Error describing EKS cluster {cluster_name}: {str(e)}")
-                        continue
-        except Exception as e:
-            print(f"Error collecting EKS clusters from {region}: {str(e)}")
+                cluster_names.extend(page.get('clusters', []))
+            
+            # Describe all clusters in parallel
+            futures = {EXECUTOR.submit(fetch_cluster, name): name for name in cluster_names}
+            for future in as_completed(futures):
+                try:
+                    items.append(future.result())
+                except Exception:
+                    logger.exception("Error describing EKS cluster %s", futures[future])
+                    continue
+        except Exception:
+            logger.exception("Error collecting EKS clusters from %s", region)
         
         return items
 
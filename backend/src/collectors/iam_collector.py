@@ -6,16 +6,37 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
-from typing import List, Dict, Any, Optional
+import logging
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import unquote
+from botocore.handlers import json_decode_policies
 from .base import BaseCollector
 
 
+logger = logging.getLogger(__name__)
+
+
+# How long an account's role listing is reused across sweeps (seconds)
+ROLES_CACHE_TTL = 60
+
+# account_id -> (fetched_at, roles); IAM is global, so region is not part of the key
+_ROLES_CACHE: Dict[Optional[str], Tuple[float, List[Dict[str, Any]]]] = {}
+
+
 class IAMCollector(BaseCollector):
     """Collects IAM roles"""
     
+    ID_FIELDS = ('id', 'role_name')
+    
     def __init__(self):
         super().__init__('iam')
     
+    @classmethod
+    def refresh(cls) -> None:
+        """Drop all cached role listings so the next collection hits IAM"""
+        _ROLES_CACHE.clear()
+    
     def collect_single_region(
         self,
         client: Any,
@@ -23,8 +44,17 @@ class IAMCollector(BaseCollector):
         account_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Collect IAM roles (IAM is global, but we include region for consistency)"""
+        cached = _ROLES_CACHE.get(account_id)
+        if cached and time.monotonic() - cached[0] < ROLES_CACHE_TTL:
+            # Shallow copies, since callers stamp fields onto the returned resources
+            return [dict(item) for item in cached[1]]
+        
         items = []
         
+        # botocore json-decodes every policy document in IAM responses by default;
+        # keep them as strings instead (this only affects this client's event hooks)
+        client.meta.events.unregister('after-call.iam', json_decode_policies)
+        
         try:
             paginator = client.get_paginator('list_roles')
             
@@ -36,11 +66,12 @@ class IAMCollector(BaseCollector):
                         'name': role['RoleName'],
                         'arn': role['Arn'],
                         'created': role['CreateDate'].isoformat() if role.get('CreateDate') else None,
-                        'assume_role_policy': role.get('AssumeRolePolicyDocument', {}),
+                        'assume_role_policy': unquote(role.get('AssumeRolePolicyDocument', '')),
                         'region': 'global'  # IAM is global
                     })
-        except Exception as e:
-            print(f"Error collecting IAM roles: {str(e)}")
+            _ROLES_CACHE[account_id] = (time.monotonic(), [dict(item) for item in items])
+        except Exception:
+            logger.exception("Error collecting IAM roles")
         
         return items
 
@@ -6,13 +6,25 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
+import logging
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from .base import BaseCollector
 
 
+logger = logging.getLogger(__name__)
+
+# Fields every DescribeDBInstances instance carries, fetched in one C-level call
+_DB_FIELDS = itemgetter(
+    'DBInstanceIdentifier', 'Engine', 'EngineVersion', 'DBInstanceStatus', 'DBInstanceClass'
+)
+
+
 class RDSCollector(BaseCollector):
     """Collects RDS instances"""
     
+    ID_FIELDS = ('id', 'db_identifier')
+    
     def __init__(self):
         super().__init__('rds')
     
@@ -30,22 +42,23 @@ class RDSCollector(BaseCollector):
             
             for page in paginator.paginate():
                 for db in page['DBInstances']:
+                    identifier, engine, engine_version, status, instance_class = _DB_FIELDS(db)
                     items.append({
-                        'id': db['DBInstanceIdentifier'],
-                        'db_identifier': db['DBInstanceIdentifier'],
-                        'name': db.get('DBInstanceIdentifier', ''),
-                        'engine': db['Engine'],
-                        'engine_version': db['EngineVersion'],
-                        'status': db['DBInstanceStatus'],
-                        'instance_class': db['DBInstanceClass'],
+                        'id': identifier,
+                        'db_identifier': identifier,
+                        'name': identifier,
+                        'engine': engine,
+                        'engine_version': engine_version,
+                        'status': status,
+                        'instance_class': instance_class,
                         'endpoint': db.get('Endpoint', {}).get('Address') if db.get('Endpoint') else None,
                         'encrypted': db.get('StorageEncrypted', False),
                         'multi_az': db.get('MultiAZ', False),
                         'created_at': db.get('InstanceCreateTime').isoformat() if db.get('InstanceCreateTime') else None,
                         'region': region
                     })
-        except Exception as e:
-            print(f"Error collecting RDS instances from {region}: {str(e)}")
+        except Exception:
+            logger.exception("Error collecting RDS instances from %s", region)
         
         return items
 
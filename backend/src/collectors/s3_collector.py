@@ -6,13 +6,132 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
-from typing import List, Dict, Any, Optional
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Dict, Any, Optional, Tuple
+from botocore.exceptions import ClientError
 from .base import BaseCollector
+from ._pool import EXECUTOR
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds a resolved bucket location (or failed lookup) is reused
+BUCKET_REGION_CACHE_TTL = 60
+
+# bucket name -> (resolved_at, region or None if the lookup failed). Bucket names
+# are globally unique, so the first region sweep resolves locations and the other
+# regions of the refresh reuse them.
+_BUCKET_REGION_CACHE: Dict[str, Tuple[float, Optional[str]]] = {}
+# bucket name -> in-flight lookup, so concurrent sweeps share a lookup instead of repeating it
+_BUCKET_REGION_LOOKUPS: Dict[str, Future] = {}
+# Guards both dicts; never held across a network call
+_BUCKET_REGION_LOCK = threading.Lock()
+
+
+def _get_location(client: Any, bucket_name: str) -> Optional[str]:
+    """Bucket region, None if the lookup fails"""
+    try:
+        location_response = client.get_bucket_location(Bucket=bucket_name)
+        return location_response.get('LocationConstraint') or 'us-east-1'
+    except Exception:
+        logger.exception("Error processing S3 bucket %s", bucket_name)
+        return None
+
+
+def _lookup_location(client: Any, bucket_name: str) -> Optional[str]:
+    """Look up a bucket's region and cache the result, including a failure"""
+    bucket_region = _get_location(client, bucket_name)
+    with _BUCKET_REGION_LOCK:
+        _BUCKET_REGION_CACHE[bucket_name] = (time.monotonic(), bucket_region)
+        _BUCKET_REGION_LOOKUPS.pop(bucket_name, None)
+    return bucket_region
+
+
+def _resolve_bucket_regions(client: Any, bucket_names: List[str]) -> Dict[str, Optional[str]]:
+    """Map bucket names to regions (None if unknown), looking up only uncached buckets"""
+    now = time.monotonic()
+    regions: Dict[str, Optional[str]] = {}
+    pending: Dict[str, Future] = {}
+    
+    # Under the lock, only read the cache and register lookups; other accounts'
+    # sweeps never wait on this account's network calls
+    with _BUCKET_REGION_LOCK:
+        for name in bucket_names:
+            cached = _BUCKET_REGION_CACHE.get(name)
+            if cached and now - cached[0] < BUCKET_REGION_CACHE_TTL:
+                regions[name] = cached[1]
+                continue
+            lookup = _BUCKET_REGION_LOOKUPS.get(name)
+            if lookup is None:
+                lookup = EXECUTOR.submit(_lookup_location, client, name)
+                _BUCKET_REGION_LOOKUPS[name] = lookup
+            pending[name] = lookup
+    
+    for name, lookup in pending.items():
+        regions[name] = lookup.result()
+    return regions
+
+
+# Error codes S3 returns when a bucket simply has no such configuration
+_NOT_CONFIGURED_CODES = frozenset({'NoSuchBucketPolicy', 'ServerSideEncryptionConfigurationNotFoundError'})
+
+
+def _log_lookup_error(error: Exception, operation: str, bucket_name: str) -> None:
+    """
+    Log a property lookup failure; the bucket is still kept with the default value
+    
+    S3 errors are debug-logged unless they just mean 'not configured'; anything else
+    (connection errors, timeouts) is unexpected and logged with its traceback.
+    """
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        if code not in _NOT_CONFIGURED_CODES:
+            logger.debug("%s failed for S3 bucket %s: %s", operation, bucket_name, code)
+    else:
+        logger.exception("%s failed for S3 bucket %s", operation, bucket_name)
+
+
+def _get_versioning(client: Any, bucket_name: str) -> str:
+    """Bucket versioning status, 'Disabled' if unavailable"""
+    try:
+        return client.get_bucket_versioning(Bucket=bucket_name).get('Status', 'Disabled')
+    except Exception as e:
+        _log_lookup_error(e, 'GetBucketVersioning', bucket_name)
+        return 'Disabled'
+
+
+def _get_encryption(client: Any, bucket_name: str) -> str:
+    """Default SSE algorithm, 'None' if unavailable"""
+    try:
+        enc_response = client.get_bucket_encryption(Bucket=bucket_name)
+        rules = enc_response['ServerSideEncryptionConfiguration'].get('Rules') or [{}]
+        return rules[0].get('ApplyServerSideEncryptionByDefault', {}).get('SSEAlgorithm', 'None')
+    except Exception as e:
+        _log_lookup_error(e, 'GetBucketEncryption', bucket_name)
+        return 'None'
+
+
+def _get_public(client: Any, bucket_name: str) -> bool:
+    """Whether the bucket policy makes it public, False if unavailable"""
+    try:
+        return client.get_bucket_policy_status(Bucket=bucket_name)['PolicyStatus']['IsPublic']
+    except Exception as e:
+        _log_lookup_error(e, 'GetBucketPolicyStatus', bucket_name)
+        return False
+
+
+# Per-bucket property lookups, in the order they are unpacked by the collector
+_PROPERTY_FETCHERS = (_get_versioning, _get_encryption, _get_public)
 
 
 class S3Collector(BaseCollector):
     """Collects S3 buckets"""
     
+    ID_FIELDS = ('id', 'bucket_name')
+    
     def __init__(self):
         super().__init__('s3')
     
@@ -29,58 +148,37 @@ class S3Collector(BaseCollector):
             # S3 is global, but we need to check bucket locations
             buckets = client.list_buckets()['Buckets']
             
-            for bucket_info in buckets:
+            # Phase 1: resolve locations of buckets not seen before, in parallel
+            bucket_regions = _resolve_bucket_regions(client, [bucket_info['Name'] for bucket_info in buckets])
+            
+            # Only include buckets in the requested region
+            in_region = [
+                bucket_info for bucket_info in buckets
+                if bucket_regions.get(bucket_info['Name']) == region
+            ]
+            
+            # Phase 2: every property call for every in-region bucket is its own task
+            property_futures = [
+                [EXECUTOR.submit(fetch, client, bucket_info['Name']) for fetch in _PROPERTY_FETCHERS]
+                for bucket_info in in_region
+            ]
+            
+            # The fetchers fall back to defaults on any error, so a transient failure
+            # never drops a bucket (which the store would then prune as stale)
+            for bucket_info, futures in zip(in_region, property_futures):
                 bucket_name = bucket_info['Name']
-                
-                try:
-                    # Get bucket location
-                    location_response = client.get_bucket_location(Bucket=bucket_name)
-                    bucket_region = location_response.get('LocationConstraint') or 'us-east-1'
-                    
-                    # Only include if bucket is in the requested region
-                    if bucket_region != region:
-                        continue
-                    
-                    # Get additional bucket properties
-                    versioning = 'Disabled'
-                    try:
-                        versioning_response = client.get_bucket_versioning(Bucket=bucket_name)
-                        versioning = versioning_response.get('Status', 'Disabled')
-                    except Exception:
-                        pass
-                    
-                    encryption = 'None'
-                    try:
-                        enc_response = client.get_bucket_encryption(Bucket=bucket_name)
-                        encryption = (
-                            enc_response['ServerSideEncryptionConfiguration']['Rules'][0]
-                            ['ApplyServerSideEncryptionByDefault']['SSEAlgorithm']
-                        )
-                    except Exception:
-                        pass
-                    
-                    public = False
-                    try:
-                        policy_status = client.get_bucket_policy_status(Bucket=bucket_name)
-                        public = policy_status['PolicyStatus']['IsPublic']
-                    except Exception:
-                        pass
-                    
-                    items.append({
-                        'id': bucket_name,
-                        'bucket_name': bucket_name,
-                        'name': bucket_name,
-                        'region': bucket_region,
-                        'versioning': versioning,
-                        'encryption': encryption,
-                        'public': public,
-                        'creation_date': bucket_info.get('CreationDate').isoformat() if bucket_info.get('CreationDate') else None
-                    })
-                except Exception as e:
-                    print(f"Error processing S3 bucket {bucket_name}: {str(e)}")
-                    continue
-        except Exception as e:
-            print(f"Error collecting S3 buckets: {str(e)}")
+                versioning, encryption, public = (future.result() for future in futures)
+                items.append({
+                    'id': bucket_name,
+                    'bucket_name': bucket_name,
+                    'name': bucket_name,
+                    'region': region,
+                    'versioning': versioning,
+                    'encryption': encryption,
+                    'public': public,
+                    'creation_date': bucket_info.get('CreationDate').isoformat() if bucket_info.get('CreationDate') else None
+                })
+        except Exception:
+            logger.exception("Error collecting S3 buckets")
         
         return items
-
@@ -6,16 +6,55 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
-from typing import List, Dict, Any, Optional
+import logging
+import time
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple
 from .base import BaseCollector
+from .utils import normalize_tags
+
+
+logger = logging.getLogger(__name__)
+
+
+# How long a region's subnet map is reused across sweeps (seconds)
+SUBNET_CACHE_TTL = 60
+
+# (account_id, region) -> (fetched_at, {vpc_id: subnet_ids}); module-level so every collector instance shares it
+_SUBNET_CACHE: Dict[Tuple[Optional[str], str], Tuple[float, Dict[str, List[str]]]] = {}
+
+
+def _subnets_by_vpc(client: Any, account_id: Optional[str], region: str) -> Dict[str, List[str]]:
+    """Map every VPC in a region to its subnet IDs, reusing a cached map younger than SUBNET_CACHE_TTL"""
+    key = (account_id, region)
+    cached = _SUBNET_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < SUBNET_CACHE_TTL:
+        return cached[1]
+    
+    # One unfiltered sweep of the region, grouped locally by VPC
+    subnets_by_vpc: Dict[str, List[str]] = defaultdict(list)
+    subnets_paginator = client.get_paginator('describe_subnets')
+    for subnets_page in subnets_paginator.paginate():
+        for subnet in subnets_page.get('Subnets', []):
+            subnets_by_vpc[subnet['VpcId']].append(subnet['SubnetId'])
+    
+    _SUBNET_CACHE[key] = (time.monotonic(), subnets_by_vpc)
+    return subnets_by_vpc
 
 
 class VPCCollector(BaseCollector):
     """Collects VPCs"""
     
+    ID_FIELDS = ('id', 'vpc_id')
+    
     def __init__(self):
         super().__init__('vpc')
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached subnet lookups"""
+        _SUBNET_CACHE.clear()
+    
     def collect_single_region(
         self,
         client: Any,
@@ -25,6 +64,13 @@ class VPCCollector(BaseCollector):
         """Collect VPCs from a region"""
         items = []
         
+        # Get all subnets in the region up front (don't fail VPC collection if this fails)
+        subnets_by_vpc: Dict[str, List[str]] = {}
+        try:
+            subnets_by_vpc = _subnets_by_vpc(client, account_id, region)
+        except Exception as subnet_error:
+            logger.warning("Failed to get subnets in %s: %s", region, subnet_error)
+        
         try:
             # Get VPCs - use paginator for consistency with other collectors
             paginator = client.get_paginator('describe_vpcs')
@@ -32,35 +78,20 @@ class VPCCollector(BaseCollector):
             for page in paginator.paginate():
                 for vpc in page.get('Vpcs', []):
                     try:
-                        tags = {tag['Key']: tag['Value'] for tag in vpc.get('Tags', [])}
+                        tags = normalize_tags(vpc.get('Tags'))
                         
-                        # Get subnets for this VPC (handle errors per VPC)
-                        subnet_ids = []
-                        try:
-                            subnets_paginator = client.get_paginator('describe_subnets')
-                            for subnets_page in subnets_paginator.paginate(
-                                Filters=[{'Name': 'vpc-id', 'Values': [vpc['VpcId']]}]
-                            ):
-                                subnet_ids.extend([s['SubnetId'] for s in subnets_page.get('Subnets', [])])
-                        except Exception as subnet_error:
-                            # Log but don't fail the entire VPC collection
-                            print(f"Warning: Failed to get subnets for VPC {vpc['VpcId']} in {region}: {str(subnet_error)}")
+                        subnet_ids = subnets_by_vpc.get(vpc['VpcId'], [])
                         
                         # Handle state - it might be a dict with 'State' key or a string
                         state = vpc.get('State')
-                        if isinstance(state, dict):
-                            state = state.get('State', 'unknown')
-                        elif isinstance(state, str):
-                            state = state
-                        else:
-                            state = 'unknown'
+                        state = state.get('State', 'unknown') if isinstance(state, dict) else (state or 'unknown')
                         
-                        # Get IPv4 CIDR blocks (can be multiple)
-                        cidr_blocks = [vpc.get('CidrBlock', '')]
-                        if 'CidrBlockAssociationSet' in vpc:
-                            for assoc in vpc['CidrBlockAssociationSet']:
-                                if assoc.get('CidrBlock') and assoc.get('CidrBlock') not in cidr_blocks:
-                                    cidr_blocks.append(assoc['CidrBlock'])
+                        # Get IPv4 CIDR blocks (can be multiple) - dict.fromkeys dedups in order
+                        cidr_blocks = list(dict.fromkeys([vpc.get('CidrBlock', '')] + [
+                            assoc['CidrBlock']
+                            for assoc in vpc.get('CidrBlockAssociationSet', [])
+                            if assoc.get('CidrBlock')
+                        ]))
                         
                         items.append({
                             'id': vpc['VpcId'],
@@ -76,15 +107,13 @@ class VPCCollector(BaseCollector):
                             'tags': tags,
                             'region': region
                         })
-                    except Exception as vpc_error:
+                    except Exception:
                         # Log error for this specific VPC but continue with others
-                        print(f"Error processing VPC {vpc.get('VpcId', 'unknown')} in {region}: {str(vpc_error)}")
+                        logger.exception("Error processing VPC %s in %s", vpc.get('VpcId', 'unknown'), region)
                         continue
                         
-        except Exception as e:
-            print(f"Error collecting VPCs from {region}: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error collecting VPCs from %s", region)
         
         return items
 
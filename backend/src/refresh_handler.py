@@ -13,9 +13,10 @@ from __future__ import annotations  # PEP 563 - Deferred evaluation of annotatio
 import json
 import os
 import sys
-from typing import Dict, Any, List, Optional
+import traceback
+from typing import Dict, Any, List, Optional, Iterable, Sequence
 from datetime import datetime, timezone
-import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add src to path for Lambda
 sys.path.insert(0, os.path.dirname(__file__))
@@ -23,14 +24,19 @@ sys.path.insert(0, os.path.dirname(__file__))
 from utils.aws_client import client_manager, AWSClientManager
 from utils.dynamodb_storage import storage
 from collectors import COLLECTORS
-from utils.response import success_response, error_response
+from utils.response import success_response, error_response, cors_preflight
+
+
+# Number of (account, service) refreshes run at once
+REFRESH_CONCURRENCY = int(os.environ.get('REFRESH_CONCURRENCY', '16'))
 
 
 def collect_and_store_inventory(
     service: str,
     account_id: str,
     role_arn: Optional[str],
-    regions: List[str]
+    regions: Sequence[str],
+    timestamp: Optional[datetime] = None
 ) -> Dict[str, Any]:
     """
     Collect inventory for a service and store in DynamoDB
@@ -40,6 +46,7 @@ def collect_and_store_inventory(
         account_id: AWS account ID
         role_arn: Optional role ARN to assume
         regions: List of regions to collect from
+        timestamp: Collection timestamp shared by the whole refresh (defaults to now)
         
     Returns:
         Dict with collection results
@@ -47,59 +54,70 @@ def collect_and_store_inventory(
     if service not in COLLECTORS:
         raise ValueError(f"Unsupported service: {service}")
     
-    collector_class = COLLECTORS[service]
-    collector = collector_class()
+    collector = COLLECTORS[service]
     
-    all_resources = []
+    stored_count = 0
     errors = []
     
     try:
-        # Get clients for all regions
-        clients = client_manager.get_clients_for_regions(
-            service,
-            regions,
-            account_id,
-            role_arn
-        )
-        
-        if not clients:
-            error_msg = f"No clients created for account {account_id}, service {service}"
-            print(f"Warning: {error_msg}")
-            errors.append(error_msg)
-            return {
-                'service': service,
-                'accountId': account_id,
-                'resourceCount': 0,
-                'errors': errors
-            }
-        
-        # Collect resources from all regions
-        resources = collector.collect_multi_region(clients, regions, account_id)
+        if service in AWSClientManager.GLOBAL_SERVICES:
+            # Global service - collect once with a single client and store under
+            # us-east-1, the region the API reads global resources from
+            client = client_manager.get_client(service, 'us-east-1', account_id, role_arn)
+            resources = collector.collect_single_region(client, 'global', account_id)
+            for resource in resources:
+                resource['accountId'] = account_id
+            resources_by_region = {'us-east-1': resources}
+        else:
+            # Get clients for all regions
+            clients = client_manager.get_clients_for_regions(
+                service,
+                regions,
+                account_id,
+                role_arn
+            )
+            
+            if not clients:
+                error_msg = f"No clients created for account {account_id}, service {service}"
+                print(f"Warning: {error_msg}")
+                errors.append(error_msg)
+                return {
+                    'service': service,
+                    'accountId': account_id,
+                    'resourceCount': 0,
+                    'errors': errors
+                }
+            
+            # Collect resources from all regions
+            resources = collector.collect_multi_region(clients, regions, account_id)
+            # Bucket by region in one pass; regions with no resources get no entry
+            resources_by_region: Dict[str, List[Dict[str, Any]]] = {}
+            for resource in resources:
+                resources_by_region.setdefault(resource.get('region'), []).append(resource)
         
-        # Store resources in DynamoDB by region
-        timestamp = datetime.now(timezone.utc)
-        for region in regions:
-            region_resources = [r for r in resources if r.get('region') == region]
-            if region_resources:
-                try:
-                    storage.store_resources(
-                        service=service,
-                        account_id=account_id,
-                        region=region,
-                        resources=region_resources,
-                        timestamp=timestamp
-                    )
-                    all_resources.extend(region_resources)
+        # Store resources for all regions in DynamoDB in one write stream
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        if resources_by_region:
+            try:
+                storage.store_resources_bulk(
+                    service=service,
+                    account_id=account_id,
+                    resources_by_region=resources_by_region,
+                    timestamp=timestamp
+                )
+                for region, region_resources in resources_by_region.items():
+                    stored_count += len(region_resources)
                     print(f"Stored {len(region_resources)} {service} resources for {account_id}/{region}")
-                except Exception as e:
-                    error_msg = f"Error storing {service} resources for {account_id}/{region}: {str(e)}"
-                    print(error_msg)
-                    errors.append(error_msg)
+            except Exception as e:
+                error_msg = f"Error storing {service} resources for {account_id}: {str(e)}"
+                print(error_msg)
+                errors.append(error_msg)
         
         return {
             'service': service,
             'accountId': account_id,
-            'resourceCount': len(all_resources),
+            'resourceCount': stored_count,
             'regions': regions,
             'errors': errors
         }
@@ -115,6 +133,60 @@ def collect_and_store_inventory(
         }
 
 
+def refresh_services(
+    services: Iterable[str],
+    account_ids: List[str],
+    timestamp: datetime
+) -> Dict[str, Any]:
+    """
+    Collect and store every (account, service) pair concurrently
+    
+    Args:
+        services: Service names to refresh
+        account_ids: Account IDs to refresh
+        timestamp: Collection timestamp stamped on every stored row
+        
+    Returns:
+        Dict with per-(account, service) results, total resource count and all errors
+    """
+    role_name = os.environ.get('INVENTORY_ROLE_NAME', 'InventoryReadRole')
+    
+    tasks = []
+    for account_id in account_ids:
+        role_arn = client_manager.build_role_arn(account_id, role_name) if account_id else None
+        
+        for service in services:
+            tasks.append({
+                'service': service,
+                'account_id': account_id,
+                'role_arn': role_arn,
+                'regions': client_manager.service_regions(service),
+                'timestamp': timestamp
+            })
+    
+    results = []
+    total_resources = 0
+    all_errors = []
+    
+    # Each task is I/O-bound on AWS APIs; throttling is retried per call by the clients' adaptive retry mode
+    with ThreadPoolExecutor(max_workers=REFRESH_CONCURRENCY, thread_name_prefix='refresh') as executor:
+        futures = [executor.submit(collect_and_store_inventory, **task) for task in tasks]
+        
+        # Accumulate totals as work finishes, logging progress for long runs
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results.append(result)
+            total_resources += result.get('resourceCount', 0)
+            all_errors.extend(result.get('errors', ()))
+            print(f"[{done}/{len(tasks)}] {result['service']} {result['accountId']} -> {result.get('resourceCount', 0)}")
+    
+    return {
+        'results': results,
+        'totalResources': total_resources,
+        'errors': all_errors
+    }
+
+
 def refresh_all_services(account_ids: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Refresh inventory for all services and accounts
@@ -133,9 +205,7 @@ def refresh_all_services(account_ids: Optional[List[str]] = None) -> Dict[str, A
     if not account_ids:
         # Fallback to current account
         try:
-            sts = boto3.client('sts', region_name='us-east-1')
-            current_account = sts.get_caller_identity()
-            account_ids = [current_account['Account']]
+            account_ids = [client_manager.get_current_account_id()]
         except Exception as e:
             print(f"Failed to get current account: {str(e)}")
             return {
@@ -143,39 +213,16 @@ def refresh_all_services(account_ids: Optional[List[str]] = None) -> Dict[str, A
                 'error': 'No accounts available'
             }
     
-    results = []
-    role_name = os.environ.get('INVENTORY_ROLE_NAME', 'InventoryReadRole')
-    
-    # Refresh all services for all accounts
-    for account_id in account_ids:
-        role_arn = client_manager.build_role_arn(account_id, role_name) if account_id else None
-        
-        for service in COLLECTORS.keys():
-            # Get regions for this service
-            if service.lower() == 'iam':
-                regions = ['us-east-1']  # IAM is global
-            else:
-                regions = AWSClientManager.AWS_REGIONS
-            
-            result = collect_and_store_inventory(
-                service=service,
-                account_id=account_id,
-                role_arn=role_arn if account_id else None,
-                regions=regions
-            )
-            results.append(result)
-    
-    total_resources = sum(r.get('resourceCount', 0) for r in results)
-    all_errors = []
-    for r in results:
-        all_errors.extend(r.get('errors', []))
+    # Refresh all services for all accounts, stamped with one timestamp
+    timestamp = datetime.now(timezone.utc)
+    refreshed = refresh_services(COLLECTORS, account_ids, timestamp)
     
     return {
         'success': True,
-        'timestamp': datetime.now(timezone.utc).isoformat(),
-        'totalResources': total_resources,
-        'results': results,
-        'errors': all_errors
+        'timestamp': timestamp.isoformat(),
+        'totalResources': refreshed['totalResources'],
+        'results': refreshed['results'],
+        'errors': refreshed['errors']
     }
 
 
@@ -194,7 +241,6 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if 'httpMethod' in event:
             # Handle CORS preflight
             if event.get("httpMethod") == "OPTIONS":
-                from utils.response import cors_preflight
                 return cors_preflight()
             
             # Parse query parameters
@@ -215,37 +261,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 
                 if not account_ids:
                     try:
-                        sts = boto3.client('sts', region_name='us-east-1')
-                        current_account = sts.get_caller_identity()
-                        account_ids = [current_account['Account']]
+                        account_ids = [client_manager.get_current_account_id()]
                     except Exception:
                         return error_response("No accounts available", 400)
                 
-                results = []
-                role_name = os.environ.get('INVENTORY_ROLE_NAME', 'InventoryReadRole')
-                
-                for account_id in account_ids:
-                    role_arn = client_manager.build_role_arn(account_id, role_name) if account_id else None
-                    
-                    if service.lower() == 'iam':
-                        regions = ['us-east-1']
-                    else:
-                        regions = AWSClientManager.AWS_REGIONS
-                    
-                    result = collect_and_store_inventory(
-                        service=service,
-                        account_id=account_id,
-                        role_arn=role_arn if account_id else None,
-                        regions=regions
-                    )
-                    results.append(result)
+                timestamp = datetime.now(timezone.utc)
+                refreshed = refresh_services([service], account_ids, timestamp)
                 
-                total_resources = sum(r.get('resourceCount', 0) for r in results)
                 return success_response({
                     'service': service,
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
-                    'totalResources': total_resources,
-                    'results': results
+                    'timestamp': timestamp.isoformat(),
+                    'totalResources': refreshed['totalResources'],
+                    'results': refreshed['results']
                 })
             else:
                 # Refresh all services
@@ -271,8 +298,6 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     except Exception as e:
         print(f"Error in refresh handler: {str(e)}")
-        import traceback
         traceback.print_exc()
-        error_details = str(e) if os.environ.get("ENVIRONMENT") != "prod" else None
-        return error_response("Refresh failed", 500, error_details, error_code="REFRESH_ERROR")
+        return error_response("Refresh failed", 500, str(e), error_code="REFRESH_ERROR")
 
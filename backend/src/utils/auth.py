@@ -7,7 +7,39 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
+
+
+# Group names that grant each role, checked in this order of precedence
+_ADMIN_GROUPS = frozenset({'admins', 'infra-admins', 'administrators'})
+_READONLY_GROUPS = frozenset({'read-only', 'cloud-readonly'})
+_ROLE_GROUPS = {
+    'admin': _ADMIN_GROUPS,
+    'readonly': _READONLY_GROUPS,
+    'security': frozenset({'security'}),
+}
+
+# Roles allowed to see each service, in the order services are listed
+_SERVICE_RULES = {
+    'ec2': frozenset({'admin', 'readonly', 'security'}),
+    's3': frozenset({'admin', 'readonly', 'security'}),
+    'rds': frozenset({'admin', 'security'}),
+    'dynamodb': frozenset({'admin'}),
+    'iam': frozenset({'admin', 'security'}),
+    'vpc': frozenset({'admin', 'security'}),
+    'eks': frozenset({'admin'}),
+    'ecs': frozenset({'admin'}),
+}
+
+# Claims that may carry group membership: Cognito groups, custom attribute,
+# and common IdP (SAML) group attribute names
+_GROUP_CLAIMS = (
+    'cognito:groups',
+    'custom:groups',
+    'groups',
+    'http://schemas.xmlsoap.org/ws/2005/05/identity/claims/groups',
+    'http://schemas.microsoft.com/ws/2008/06/identity/claims/groups',
+)
 
 
 def extract_groups_from_claims(claims: dict) -> List[str]:
@@ -19,43 +51,18 @@ def extract_groups_from_claims(claims: dict) -> List[str]:
     - custom:groups (Custom attribute)
     - IdP group claims (e.g., from SAML)
     """
-    groups = []
-
-    # Cognito groups
-    cognito_groups = claims.get('cognito:groups', '')
-    if cognito_groups:
-        if isinstance(cognito_groups, str):
-            groups.extend([g.strip()
-                          for g in cognito_groups.split(',') if g.strip()])
-        elif isinstance(cognito_groups, list):
-            groups.extend(cognito_groups)
-
-    # Custom groups attribute
-    custom_groups = claims.get('custom:groups', '')
-    if custom_groups:
-        if isinstance(custom_groups, str):
-            groups.extend([g.strip()
-                          for g in custom_groups.split(',') if g.strip()])
-        elif isinstance(custom_groups, list):
-            groups.extend(custom_groups)
-
-    # IdP group claims (common SAML attribute names)
-    idp_group_attrs = [
-        'groups',
-        'http://schemas.xmlsoap.org/ws/2005/05/identity/claims/groups',
-        'http://schemas.microsoft.com/ws/2008/06/identity/claims/groups'
-    ]
-
-    for attr in idp_group_attrs:
-        idp_groups = claims.get(attr, '')
-        if idp_groups:
-            if isinstance(idp_groups, str):
-                groups.extend([g.strip()
-                              for g in idp_groups.split(',') if g.strip()])
-            elif isinstance(idp_groups, list):
-                groups.extend(idp_groups)
-
-    return list(set(groups))  # Remove duplicates
+    groups = set()  # Set accumulator removes duplicates across claims
+
+    for claim in _GROUP_CLAIMS:
+        value = claims.get(claim)
+        if not value:
+            continue
+        if isinstance(value, str):
+            groups.update(g for g in (g.strip() for g in value.split(',')) if g)
+        elif isinstance(value, list):
+            groups.update(value)
+
+    return list(groups)
 
 
 def can_access_service(groups: List[str], service: str) -> bool:
@@ -66,31 +73,32 @@ def can_access_service(groups: List[str], service: str) -> bool:
     - admins / infra-admins: All services
     - read-only / cloud-readonly: EC2, S3 only
     - security: IAM, EC2, S3, RDS (security-focused)
-    - SAML users: Full access (temporary - configure proper groups in Azure AD)
+    - SAML users: Full access (treated as admins)
     """
-    service_lower = service.lower()
+    roles = _user_roles(frozenset(groups))
 
-    # Admin groups have full access
-    if any(group in groups for group in ['admins', 'infra-admins', 'administrators']):
+    # Admins see every service, including ones without an entry in _SERVICE_RULES
+    if 'admin' in roles:
         return True
 
-    # SAML authenticated users - grant full access temporarily
-    # TODO: Configure proper group mappings in Azure AD SAML attributes
-    if any('_SAML' in group for group in groups):
-        return True
+    return bool(_SERVICE_RULES.get(service.lower(), frozenset()) & roles)
+
 
-    # Read-only groups
-    if any(group in groups for group in ['read-only', 'cloud-readonly']):
-        return service_lower in ['ec2', 's3']
+def _user_roles(group_set: FrozenSet[str]) -> FrozenSet[str]:
+    """Resolve a group set to the role it grants (empty if none)"""
+    # SAML-federated users get admin access; their IdP doesn't send mapped group names
+    if any('_SAML' in group for group in group_set):
+        return frozenset({'admin'})
 
-    # Security group
-    if 'security' in groups:
-        return service_lower in ['iam', 'ec2', 's3', 'rds', 'vpc']
+    # The first matching role wins, so read-only is not widened by other groups
+    for role, role_groups in _ROLE_GROUPS.items():
+        if group_set & role_groups:
+            return frozenset({role})
 
-    return False
+    return frozenset()
 
 
 def get_accessible_services(groups: List[str]) -> List[str]:
     """Get list of services user can access"""
-    all_services = ['ec2', 's3', 'rds', 'dynamodb', 'iam', 'vpc', 'eks', 'ecs']
-    return [s for s in all_services if can_access_service(groups, s)]
+    roles = _user_roles(frozenset(groups))
+    return [service for service, allowed in _SERVICE_RULES.items() if allowed & roles]
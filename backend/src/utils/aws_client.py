@@ -8,29 +8,118 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
 import boto3
-from typing import Optional, List, Dict, Any
+import functools
+import random
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Callable, Tuple, TypeVar
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 
 
+# Shared config for every client this module creates. Collectors fan calls out
+# over threads, so the urllib3 pool must be at least as large as the per-client
+# worker count. Keep-alive avoids re-handshaking idle sockets; adaptive retries
+# absorb throttling.
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+
+# Error codes STS and Organizations return when a caller is throttled
+THROTTLE_ERROR_CODES = frozenset({
+    'Throttling', 'ThrottlingException', 'TooManyRequestsException', 'RequestLimitExceeded'
+})
+
+# Backstop for throttling that outlasts the clients' own adaptive retries
+THROTTLE_RETRY_ATTEMPTS = 5
+THROTTLE_BASE_DELAY = 0.5  # seconds
+THROTTLE_MAX_DELAY = 8.0  # seconds
+
+T = TypeVar('T')
+
+
+def _retry_throttled(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Call fn, retrying throttling errors with exponential backoff and full jitter
+    
+    Jitter spreads out retries from concurrent refresh workers so they don't
+    hit STS/Organizations again in lockstep. Other errors propagate immediately.
+    """
+    for attempt in range(THROTTLE_RETRY_ATTEMPTS - 1):
+        try:
+            return fn(*args, **kwargs)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in THROTTLE_ERROR_CODES:
+                raise
+            time.sleep(random.uniform(0, min(THROTTLE_MAX_DELAY, THROTTLE_BASE_DELAY * 2 ** attempt)))
+    
+    # Last attempt - let any error propagate
+    return fn(*args, **kwargs)
+
+
+def _create_global_client(service: str):
+    """Create a us-east-1 client at import time, or None if that fails (e.g. no region/endpoint)"""
+    try:
+        return boto3.client(service, region_name='us-east-1', config=CLIENT_CONFIG)
+    except Exception as e:
+        print(f"Failed to create {service} client at startup: {str(e)}")
+        return None
+
+
+# STS and Organizations clients for the function's own credentials - created once
+# per container (INIT phase) and reused by warm invocations
+_STS_CLIENT = _create_global_client('sts')
+_ORG_CLIENT = _create_global_client('organizations')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_current_account_id() -> str:
+    """Get the account ID of the function's own credentials (cached per container)"""
+    sts = _STS_CLIENT or boto3.client('sts', region_name='us-east-1', config=CLIENT_CONFIG)
+    return sts.get_caller_identity()['Account']
+
+
 class AWSClientManager:
     """Manages AWS client creation with multi-account and multi-region support"""
     
     # AWS regions list
-    AWS_REGIONS = [
+    AWS_REGIONS = (
         'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
         'eu-west-1', 'eu-west-2', 'eu-west-3', 'eu-central-1',
         'ap-southeast-1', 'ap-southeast-2', 'ap-northeast-1', 'ap-northeast-2',
         'ap-south-1', 'ca-central-1', 'sa-east-1'
-    ]
+    )
+    AWS_REGIONS_SET = frozenset(AWS_REGIONS)
+    
+    # Global services - a single us-east-1 client covers every region
+    GLOBAL_SERVICES = frozenset({'iam', 'cloudfront', 'route53'})
+    
+    # How long the account list is reused across warm invocations (seconds)
+    ACCOUNTS_CACHE_TTL = int(os.environ.get('ACCOUNTS_TTL_SEC', '900'))
+    
+    # Assumed-role credentials are re-assumed once they are this close to expiring
+    CREDENTIALS_REFRESH_MARGIN = timedelta(minutes=5)
     
     def __init__(self):
         self.external_id = os.environ.get('EXTERNAL_ID', '')
         self.role_session_name = os.environ.get('ROLE_SESSION_NAME', 'InventoryDashboard')
+        self._accounts_cache: Optional[List[Dict[str, str]]] = None
+        self._accounts_cached_at = 0.0
+        # role_arn -> credentials (STS credentials are not region-scoped)
+        self._cred_cache: Dict[str, Dict[str, Any]] = {}
+        self._cred_locks: Dict[str, threading.Lock] = {}
     
     def get_sts_client(self, region: str = 'us-east-1'):
-        """Get STS client for assuming roles"""
-        return boto3.client('sts', region_name=region)
+        """Get STS client for assuming roles (the shared client for us-east-1)"""
+        if region == 'us-east-1' and _STS_CLIENT is not None:
+            return _STS_CLIENT
+        return boto3.client('sts', region_name=region, config=CLIENT_CONFIG)
     
     def assume_role(self, role_arn: str, region: str = 'us-east-1') -> Dict[str, Any]:
         """
@@ -43,6 +132,18 @@ class AWSClientManager:
         Returns:
             Credentials dict with AccessKeyId, SecretAccessKey, SessionToken
         """
+        # One lock per role so concurrent refreshes of the same account assume it once
+        with self._cred_locks.setdefault(role_arn, threading.Lock()):
+            credentials = self._cred_cache.get(role_arn)
+            if credentials and credentials['Expiration'] - datetime.now(timezone.utc) > self.CREDENTIALS_REFRESH_MARGIN:
+                return credentials
+            
+            credentials = self._assume_role(role_arn, region)
+            self._cred_cache[role_arn] = credentials
+            return credentials
+    
+    def _assume_role(self, role_arn: str, region: str) -> Dict[str, Any]:
+        """Call STS AssumeRole (uncached)"""
         sts = self.get_sts_client(region)
         
         try:
@@ -55,7 +156,7 @@ class AWSClientManager:
             if self.external_id:
                 assume_role_kwargs['ExternalId'] = self.external_id
             
-            response = sts.assume_role(**assume_role_kwargs)
+            response = _retry_throttled(sts.assume_role, **assume_role_kwargs)
             return response['Credentials']
         except Exception as e:
             print(f"Failed to assume role {role_arn}: {str(e)}")
@@ -80,11 +181,20 @@ class AWSClientManager:
         Returns:
             Boto3 client for the service
         """
-        kwargs = {'region_name': region}
-        
         # If account_id and role_arn are provided, assume role
-        if account_id and role_arn:
-            credentials = self.assume_role(role_arn, region)
+        credentials = self.assume_role(role_arn) if account_id and role_arn else None
+        return self._build_client(service, region, credentials)
+    
+    def _build_client(
+        self,
+        service: str,
+        region: str,
+        credentials: Optional[Dict[str, Any]] = None
+    ):
+        """Create a client, using assumed-role credentials if given"""
+        kwargs = {'region_name': region, 'config': CLIENT_CONFIG}
+        
+        if credentials:
             kwargs['aws_access_key_id'] = credentials['AccessKeyId']
             kwargs['aws_secret_access_key'] = credentials['SecretAccessKey']
             kwargs['aws_session_token'] = credentials['SessionToken']
@@ -112,27 +222,69 @@ class AWSClientManager:
         """
         clients = {}
         
-        # For IAM (global service), only need one client
-        if service.lower() == 'iam':
-            # IAM is global, use us-east-1
+        # STS credentials aren't region-scoped - assume the role once for every region
+        credentials = None
+        if account_id and role_arn:
+            try:
+                credentials = self.assume_role(role_arn)
+            except Exception as e:
+                print(f"Failed to create {service} clients (account: {account_id}): {str(e)}")
+                return clients
+        
+        # For global services, only need one client
+        if service.lower() in self.GLOBAL_SERVICES:
+            # Global services are served from us-east-1
             region = 'us-east-1'
             try:
-                clients[region] = self.get_client(service, region, account_id, role_arn)
+                clients[region] = self._build_client(service, region, credentials)
             except Exception as e:
                 print(f"Failed to create {service} client for {region}: {str(e)}")
             return clients
         
-        # For regional services, create clients for each region
-        for region in regions:
+        def create(region: str) -> None:
             try:
-                clients[region] = self.get_client(service, region, account_id, role_arn)
+                clients[region] = self._build_client(service, region, credentials)
             except Exception as e:
                 print(f"Failed to create {service} client for {region} (account: {account_id}): {str(e)}")
                 # Continue with other regions even if one fails
         
+        if not regions:
+            return clients
+        
+        # Create the first client on this thread - boto3's default session lazily
+        # loads shared state on first use, which isn't safe to race
+        create(regions[0])
+        
+        # For the remaining regional clients, create in parallel
+        if len(regions) > 1:
+            with ThreadPoolExecutor(max_workers=len(regions) - 1) as executor:
+                list(executor.map(create, regions[1:]))
+        
         return clients
     
     def get_accounts_from_org(self) -> List[Dict[str, str]]:
+        """
+        Get list of accounts, cached for ACCOUNTS_CACHE_TTL seconds
+        
+        The account set changes rarely, so warm invocations reuse the last
+        result instead of walking the organization again.
+        
+        Returns:
+            List of dicts with accountId and accountName
+        """
+        if (
+            self._accounts_cache is not None
+            and time.monotonic() - self._accounts_cached_at < self.ACCOUNTS_CACHE_TTL
+        ):
+            return self._accounts_cache
+        
+        accounts = self._list_accounts()
+        if accounts:
+            self._accounts_cache = accounts
+            self._accounts_cached_at = time.monotonic()
+        return accounts
+    
+    def _list_accounts(self) -> List[Dict[str, str]]:
         """
         Get list of accounts from AWS Organizations
         
@@ -146,17 +298,22 @@ class AWSClientManager:
         """
         # Try AWS Organizations first
         try:
-            orgs = boto3.client('organizations', region_name='us-east-1')
-            accounts = []
+            orgs = _ORG_CLIENT or boto3.client('organizations', region_name='us-east-1', config=CLIENT_CONFIG)
             
-            paginator = orgs.get_paginator('list_accounts')
-            for page in paginator.paginate():
-                for account in page['Accounts']:
-                    if account['Status'] == 'ACTIVE':
-                        accounts.append({
-                            'accountId': account['Id'],
-                            'accountName': account['Name']
-                        })
+            def list_org_accounts() -> List[Dict[str, str]]:
+                org_accounts = []
+                paginator = orgs.get_paginator('list_accounts')
+                for page in paginator.paginate():
+                    for account in page['Accounts']:
+                        if account['Status'] == 'ACTIVE':
+                            org_accounts.append({
+                                'accountId': account['Id'],
+                                'accountName': account['Name']
+                            })
+                return org_accounts
+            
+            # A throttled page restarts the listing after backing off
+            accounts = _retry_throttled(list_org_accounts)
             
             if accounts:
                 print(f"Found {len(accounts)} accounts from AWS Organizations")
@@ -191,9 +348,7 @@ class AWSClientManager:
         
         # Final fallback: Current account
         try:
-            sts = boto3.client('sts', region_name='us-east-1')
-            current_account = sts.get_caller_identity()
-            account_id = current_account['Account']
+            account_id = self.get_current_account_id()
             print(f"Using current account: {account_id}")
             return [{
                 'accountId': account_id,
@@ -203,9 +358,28 @@ class AWSClientManager:
             print(f"Failed to get current account: {str(e)}")
             return []
     
-    def build_role_arn(self, account_id: str, role_name: str = 'InventoryReadRole') -> str:
-        """Build role ARN for an account"""
+    def get_current_account_id(self) -> str:
+        """
+        Get the account ID of the credentials this function runs with
+        
+        The caller identity never changes for the lifetime of a container,
+        so STS is only called once.
+        """
+        return _get_current_account_id()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def build_role_arn(account_id: str, role_name: str = 'InventoryReadRole') -> str:
+        """Build role ARN for an account (memoized - called per account per service)"""
         return f"arn:aws:iam::{account_id}:role/{role_name}"
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def service_regions(service: str) -> Tuple[str, ...]:
+        """Regions to collect a service from: us-east-1 only for global services, else all"""
+        if service.lower() in AWSClientManager.GLOBAL_SERVICES:
+            return ('us-east-1',)
+        return AWSClientManager.AWS_REGIONS
 
 
 # Global instance
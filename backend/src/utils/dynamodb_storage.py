@@ -10,54 +10,257 @@ from __future__ import annotations  # PEP 563 - Deferred evaluation of annotatio
 import boto3
 import json
 import os
-from typing import List, Dict, Any, Optional
+import random
+import threading
+import time
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+from typing import List, Dict, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 
+try:
+    from amazondax import AmazonDaxClient
+except ImportError:
+    # DAX is optional - only needed when DAX_ENDPOINT is configured
+    AmazonDaxClient = None
+
+
+# Keep-alive reuses sockets across warm invocations; the pool covers the parallel
+# partition queries; short timeouts let adaptive retries recover from a stalled call
+STORAGE_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=1,
+    read_timeout=3,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# DynamoDB client - created once per container (INIT phase) and reused by warm invocations.
+# A low-level client rather than a resource: clients are thread-safe, resources aren't,
+# and the write, query and scan workers all share this one.
+_DYNAMODB = boto3.client(
+    'dynamodb',
+    region_name=os.environ.get('AWS_REGION', 'us-east-1'),
+    config=STORAGE_CONFIG
+)
+
+
+def _create_dax_client():
+    """Create a DAX client when DAX_ENDPOINT is set, or None to read from DynamoDB directly"""
+    endpoint = os.environ.get('DAX_ENDPOINT')
+    if not endpoint:
+        return None
+    if AmazonDaxClient is None:
+        print("DAX_ENDPOINT is set but amazondax is not installed - reading from DynamoDB")
+        return None
+    try:
+        return AmazonDaxClient(
+            endpoint_url=endpoint,
+            region_name=os.environ.get('AWS_REGION', 'us-east-1')
+        )
+    except Exception as e:
+        print(f"Failed to create DAX client, reading from DynamoDB: {str(e)}")
+        return None
+
+
+# Optional DAX cluster in front of the inventory table for resource reads
+_DAX = _create_dax_client()
+
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+def _serialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Plain Python attributes -> DynamoDB wire format ({'S': ...}, {'N': ...}, ...)"""
+    return {key: _SERIALIZER.serialize(value) for key, value in item.items()}
+
+
+def _deserialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    """DynamoDB wire format -> plain Python attributes (numbers as Decimal)"""
+    return {key: _DESERIALIZER.deserialize(value) for key, value in item.items()}
+
+
+class _Table:
+    """
+    Thread-safe stand-in for a boto3 Table: query/scan on a shared low-level client
+    
+    Takes and returns plain Python values like Table.query/Table.scan, converting
+    ExpressionAttributeValues, ExclusiveStartKey, Items and LastEvaluatedKey.
+    """
+    
+    def __init__(self, client: Any, table_name: str):
+        self.client = client
+        self.table_name = table_name
+    
+    def query(self, **kwargs) -> Dict[str, Any]:
+        return self._read(self.client.query, kwargs)
+    
+    def scan(self, **kwargs) -> Dict[str, Any]:
+        return self._read(self.client.scan, kwargs)
+    
+    def _read(self, operation: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        for key in ('ExpressionAttributeValues', 'ExclusiveStartKey'):
+            if key in kwargs:
+                kwargs[key] = _serialize(kwargs[key])
+        response = operation(TableName=self.table_name, **kwargs)
+        response['Items'] = [_deserialize(item) for item in response.get('Items', [])]
+        if 'LastEvaluatedKey' in response:
+            response['LastEvaluatedKey'] = _deserialize(response['LastEvaluatedKey'])
+        return response
+
+
+def _pk(service: str, account_id: str, region: str) -> str:
+    """Inventory partition key: service#accountId#region"""
+    return service + '#' + account_id + '#' + region
+
+
+# Resource fields tried in order for the inventory sort key; the first non-empty one wins
+_ID_FIELDS = (
+    'id', 'instance_id', 'bucket_name', 'table_name',
+    'role_name', 'vpc_id', 'cluster_name', 'db_identifier'
+)
+
+# Leaf types stored and read back unchanged by the item converters
+_PASSTHROUGH_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _to_dynamodb(value: Any) -> Any:
+    """
+    Convert Python types to DynamoDB-compatible types
+    
+    Floats become Decimal (DynamoDB doesn't support float), unsupported types become
+    strings. Containers are copied so the caller's resource is left untouched; an
+    explicit stack avoids a Python frame per nested value.
+    """
+    to_decimal = Decimal
+    root = [value]
+    stack = [(root, 0, value)]
+    while stack:
+        parent, key, v = stack.pop()
+        v_type = type(v)
+        if v_type in _PASSTHROUGH_TYPES:
+            continue
+        if v_type is float:
+            parent[key] = to_decimal(str(v))
+        elif isinstance(v, dict):
+            copy = dict(v)
+            parent[key] = copy
+            stack.extend((copy, k, child) for k, child in copy.items() if type(child) not in _PASSTHROUGH_TYPES)
+        elif isinstance(v, list):
+            copy = list(v)
+            parent[key] = copy
+            stack.extend((copy, i, child) for i, child in enumerate(copy) if type(child) not in _PASSTHROUGH_TYPES)
+        elif isinstance(v, float):
+            parent[key] = to_decimal(str(v))
+        elif isinstance(v, int):
+            continue
+        else:
+            parent[key] = str(v)
+    return root[0]
+
+
+def _from_dynamodb(value: Any) -> Any:
+    """
+    Convert DynamoDB types back to Python types (Decimal -> float)
+    
+    Items fresh from a response aren't shared, so containers are updated in place.
+    """
+    root = [value]
+    stack = [(root, 0, value)]
+    while stack:
+        parent, key, v = stack.pop()
+        if isinstance(v, Decimal):
+            parent[key] = float(v)
+        elif isinstance(v, dict):
+            stack.extend((v, k, child) for k, child in v.items() if type(child) not in _PASSTHROUGH_TYPES)
+        elif isinstance(v, list):
+            stack.extend((v, i, child) for i, child in enumerate(v) if type(child) not in _PASSTHROUGH_TYPES)
+    return root[0]
+
 
 class DynamoDBStorage:
     """Manages inventory data storage in DynamoDB"""
     
+    # Maximum partitions queried concurrently in get_resources
+    MAX_QUERY_WORKERS = 16
+    
+    # Reads across all accounts spanning more partitions than this use a parallel
+    # scan with SCAN_SEGMENTS segments instead of one query per partition
+    SCAN_PARTITION_THRESHOLD = int(os.environ.get('SCAN_PARTITION_THRESHOLD', '100'))
+    SCAN_SEGMENTS = 10
+    
+    # BatchWriteItem accepts at most 25 requests; up to WRITE_WORKERS batches are in flight
+    BATCH_SIZE = 25
+    WRITE_WORKERS = 10
+    
+    # Unprocessed items are resent with exponential backoff plus jitter, at most
+    # WRITE_RETRY_ATTEMPTS calls per batch
+    WRITE_RETRY_ATTEMPTS = 10
+    WRITE_BACKOFF_BASE = 0.05
+    WRITE_BACKOFF_MAX = 5.0
+    
+    # Metadata GSI keyed by service and sorted by updatedAt
+    METADATA_UPDATED_INDEX = 'service-updatedAt-index'
+    
+    # How long warm invocations reuse read results (seconds, 0 disables), and how
+    # many distinct reads are kept
+    CACHE_TTL = int(os.environ.get('STORAGE_CACHE_TTL_SEC', '60'))
+    CACHE_MAX_ENTRIES = 256
+    
     def __init__(self):
         self.table_name = os.environ.get('INVENTORY_TABLE_NAME', 'aws-inventory-data')
         self.metadata_table_name = os.environ.get('METADATA_TABLE_NAME', 'aws-inventory-metadata')
-        self.dynamodb = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-1'))
-        self.table = self.dynamodb.Table(self.table_name)
-        self.metadata_table = self.dynamodb.Table(self.metadata_table_name)
+        self.client = _DYNAMODB
+        self.table = _Table(self.client, self.table_name)
+        self.metadata_table = _Table(self.client, self.metadata_table_name)
+        # Resource reads go through DAX when configured; writes, the delete sweep and
+        # metadata (read for freshness) always use DynamoDB directly. DAX caches query
+        # and scan results separately from items and write-through doesn't refresh
+        # them, so with DAX, reads can lag a refresh by up to the cluster's query
+        # TTL (5 minutes by default) on top of CACHE_TTL.
+        self.read_table = _Table(_DAX, self.table_name) if _DAX is not None else self.table
+        # key -> (cached_at, value); see _cache_get/_cache_put
+        self._resource_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._update_time_cache: Dict[Optional[str], Tuple[float, Optional[datetime]]] = {}
+        self._cache_lock = threading.Lock()
+    
+    def _cache_get(self, cache: Dict[Any, Tuple[float, Any]], key: Any) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key that was stored less than CACHE_TTL seconds ago"""
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.CACHE_TTL:
+            return True, entry[1]
+        return False, None
+    
+    def _cache_put(self, cache: Dict[Any, Tuple[float, Any]], key: Any, value: Any) -> None:
+        """Store a value, evicting expired entries (then the oldest) when the cache is full"""
+        if self.CACHE_TTL <= 0:
+            return
+        now = time.monotonic()
+        with self._cache_lock:
+            if key not in cache and len(cache) >= self.CACHE_MAX_ENTRIES:
+                for stale in [k for k, (cached_at, _) in cache.items() if now - cached_at >= self.CACHE_TTL]:
+                    del cache[stale]
+                if len(cache) >= self.CACHE_MAX_ENTRIES:
+                    del cache[next(iter(cache))]
+            cache[key] = (now, value)
+    
+    def invalidate(self, service: str) -> None:
+        """Drop cached reads for a service (and the overall last update time) after a write"""
+        with self._cache_lock:
+            for key in [k for k in self._resource_cache if k[0] == service]:
+                del self._resource_cache[key]
+            self._update_time_cache.pop(service, None)
+            self._update_time_cache.pop(None, None)
     
     def _convert_to_dynamodb_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Python types to DynamoDB-compatible types"""
-        def convert_value(value: Any) -> Any:
-            if isinstance(value, dict):
-                return {k: convert_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [convert_value(v) for v in value]
-            elif isinstance(value, (int, float)):
-                # DynamoDB doesn't support float, convert to Decimal
-                return Decimal(str(value)) if isinstance(value, float) else value
-            elif isinstance(value, bool):
-                return value
-            elif value is None:
-                return None
-            else:
-                return str(value)
-        
-        return convert_value(item)
+        return _to_dynamodb(item)
     
     def _convert_from_dynamodb_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Convert DynamoDB types back to Python types"""
-        def convert_value(value: Any) -> Any:
-            if isinstance(value, dict):
-                return {k: convert_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [convert_value(v) for v in value]
-            elif isinstance(value, Decimal):
-                # Convert Decimal to float
-                return float(value)
-            else:
-                return value
-        
-        return convert_value(item)
+        return _from_dynamodb(item)
     
     def store_resources(
         self,
@@ -77,74 +280,143 @@ class DynamoDBStorage:
             resources: List of resource dictionaries
             timestamp: Timestamp for this collection (defaults to now)
         """
+        self.store_resources_bulk(service, account_id, {region: resources}, timestamp)
+    
+    def store_resources_bulk(
+        self,
+        service: str,
+        account_id: str,
+        resources_by_region: Dict[str, List[Dict[str, Any]]],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Store resources for several regions of one service/account in one write stream
+        
+        Args:
+            service: Service name (e.g., 'ec2', 's3')
+            account_id: AWS account ID
+            resources_by_region: Dict mapping region -> list of resource dictionaries
+            timestamp: Timestamp for this collection (defaults to now)
+        """
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
         
         timestamp_str = timestamp.isoformat()
+        ttl = int(timestamp.timestamp() + (90 * 24 * 60 * 60))  # 90 days TTL
         
-        # Delete existing items for this service/account/region combination
-        self._delete_resources(service, account_id, region)
+        # Upsert: puts overwrite rows that still exist, so readers never see an
+        # emptied partition mid-refresh; rows this run didn't write are pruned below.
+        # Items are keyed by (pk, sk) so a duplicate id keeps the last resource - a
+        # BatchWriteItem request with duplicate keys is rejected.
+        items = {}
+        for region, resources in resources_by_region.items():
+            pk = _pk(service, account_id, region)
+            # Attributes shared by every row of the partition, copied per resource
+            base_item = {
+                'pk': pk,
+                'service': service,
+                'accountId': account_id,
+                'region': region,
+                'updatedAt': timestamp_str,
+                'ttl': ttl
+            }
+            for resource in resources:
+                item = self._build_item(base_item, resource)
+                items[(pk, item['sk'])] = item
+        self._write_parallel([{'PutRequest': {'Item': item}} for item in items.values()])
         
-        # Batch write new items (DynamoDB batch write limit is 25 items)
-        batch_size = 25
-        for i in range(0, len(resources), batch_size):
-            batch = resources[i:i + batch_size]
-            
-            with self.table.batch_writer() as writer:
-                for resource in batch:
-                    # Create composite key: service#accountId#region#resourceId
-                    resource_id = resource.get('id') or resource.get('instance_id') or resource.get('bucket_name') or \
-                                 resource.get('table_name') or resource.get('role_name') or resource.get('vpc_id') or \
-                                 resource.get('cluster_name') or resource.get('db_identifier') or 'unknown'
-                    
-                    item = {
-                        'pk': f"{service}#{account_id}#{region}",
-                        'sk': resource_id,
-                        'service': service,
-                        'accountId': account_id,
-                        'region': region,
-                        'resourceId': resource_id,
-                        'data': self._convert_to_dynamodb_item(resource),
-                        'updatedAt': timestamp_str,
-                        'ttl': int((timestamp.timestamp() + (90 * 24 * 60 * 60)))  # 90 days TTL
-                    }
-                    
-                    writer.put_item(Item=item)
+        # Delete resources that disappeared since the previous collection
+        stale_keys = []
+        for region in resources_by_region:
+            stale_keys.extend(self._stale_keys(service, account_id, region, timestamp_str))
+        self._write_parallel([{'DeleteRequest': {'Key': key}} for key in stale_keys])
         
-        # Update metadata
-        self._update_metadata(service, account_id, region, timestamp_str, len(resources))
+        # Update metadata. Only this call's rows are written, and a failed write raises
+        # so the caller records this account's refresh as failed.
+        metadata_items = [
+            self._metadata_item(service, account_id, region, timestamp_str, len(resources))
+            for region, resources in resources_by_region.items()
+        ]
+        self._write_parallel(
+            [{'PutRequest': {'Item': item}} for item in metadata_items],
+            self.metadata_table_name
+        )
+        
+        self.invalidate(service)
     
-    def _delete_resources(self, service: str, account_id: str, region: str) -> None:
-        """Delete existing resources for a service/account/region combination"""
-        pk = f"{service}#{account_id}#{region}"
+    def _build_item(self, base_item: Dict[str, Any], resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the inventory table item for one resource from its partition's shared attributes"""
+        # Create composite key: service#accountId#region#resourceId
+        resource_id = next(filter(None, map(resource.get, _ID_FIELDS)), 'unknown')
         
-        # Query all items with this partition key
-        response = self.table.query(
-            KeyConditionExpression='pk = :pk',
-            ExpressionAttributeValues={':pk': pk},
-            ProjectionExpression='pk, sk'
-        )
+        item = base_item.copy()
+        item['sk'] = resource_id
+        item['resourceId'] = resource_id
+        item['data'] = self._convert_to_dynamodb_item(resource)
+        return item
+    
+    def _stale_keys(self, service: str, account_id: str, region: str, timestamp_str: str) -> List[Dict[str, str]]:
+        """Keys of a service/account/region partition not rewritten by the collection at timestamp_str"""
+        pk = _pk(service, account_id, region)
         
-        # Batch delete
-        items_to_delete = response.get('Items', [])
-        if items_to_delete:
-            with self.table.batch_writer() as writer:
-                for item in items_to_delete:
-                    writer.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+        # Rows written by this collection carry updatedAt == timestamp_str; ISO-8601 UTC
+        # timestamps in the same format order correctly as strings
+        query_kwargs = {
+            'KeyConditionExpression': 'pk = :pk',
+            'FilterExpression': 'updatedAt < :ts',
+            'ExpressionAttributeValues': {':pk': pk, ':ts': timestamp_str},
+            'ProjectionExpression': 'pk, sk'
+        }
+        keys = []
+        while True:
+            response = self.table.query(**query_kwargs)
+            keys.extend({'pk': item['pk'], 'sk': item['sk']} for item in response.get('Items', []))
             
-            # Handle pagination if there are more items
-            while 'LastEvaluatedKey' in response:
-                response = self.table.query(
-                    KeyConditionExpression='pk = :pk',
-                    ExpressionAttributeValues={':pk': pk},
-                    ProjectionExpression='pk, sk',
-                    ExclusiveStartKey=response['LastEvaluatedKey']
-                )
-                items_to_delete = response.get('Items', [])
-                if items_to_delete:
-                    with self.table.batch_writer() as writer:
-                        for item in items_to_delete:
-                            writer.delete_item(Key={'pk': item['pk'], 'sk': item['sk']})
+            if 'LastEvaluatedKey' not in response:
+                return keys
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    def _write_parallel(self, requests: List[Dict[str, Any]], table_name: Optional[str] = None) -> None:
+        """Send put/delete requests as 25-request batches, up to WRITE_WORKERS at once"""
+        table_name = table_name or self.table_name
+        chunks = [requests[i:i + self.BATCH_SIZE] for i in range(0, len(requests), self.BATCH_SIZE)]
+        if len(chunks) <= 1:
+            for chunk in chunks:
+                self._write_batch(chunk, table_name)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.WRITE_WORKERS, len(chunks))) as executor:
+            # list() surfaces the first failed batch
+            list(executor.map(lambda chunk: self._write_batch(chunk, table_name), chunks))
+    
+    def _write_batch(self, requests: List[Dict[str, Any]], table_name: Optional[str] = None) -> None:
+        """
+        Write one batch of put/delete requests, resending only the unprocessed subset
+        
+        Raises:
+            RuntimeError: If items are still unprocessed after WRITE_RETRY_ATTEMPTS calls
+        """
+        table_name = table_name or self.table_name
+        # Unprocessed requests come back already serialized and are resent as-is
+        requests = [
+            {'PutRequest': {'Item': _serialize(request['PutRequest']['Item'])}}
+            if 'PutRequest' in request
+            else {'DeleteRequest': {'Key': _serialize(request['DeleteRequest']['Key'])}}
+            for request in requests
+        ]
+        for attempt in range(self.WRITE_RETRY_ATTEMPTS):
+            response = self.client.batch_write_item(RequestItems={table_name: requests})
+            requests = response.get('UnprocessedItems', {}).get(table_name)
+            if not requests:
+                return
+            
+            if attempt < self.WRITE_RETRY_ATTEMPTS - 1:
+                delay = min(self.WRITE_BACKOFF_MAX, self.WRITE_BACKOFF_BASE * 2 ** attempt)
+                time.sleep(delay + random.uniform(0, self.WRITE_BACKOFF_BASE))
+        
+        raise RuntimeError(
+            f"{len(requests)} items still unprocessed after {self.WRITE_RETRY_ATTEMPTS} BatchWriteItem calls"
+        )
     
     def get_resources(
         self,
@@ -161,53 +433,213 @@ class DynamoDBStorage:
             regions: Optional list of regions to filter
             
         Returns:
-            List of resource dictionaries
+            List of resource dictionaries. The list is the caller's own, but the
+            resource dicts are shared with the read cache and must not be mutated.
         """
-        all_resources = []
+        # Results are already converted, so a warm hit skips both the queries and the conversion
+        key = (service, tuple(sorted(account_ids)) if account_ids is not None else None,
+               tuple(sorted(regions)) if regions is not None else None)
+        hit, cached = self._cache_get(self._resource_cache, key)
+        if hit:
+            return list(cached)
+        
+        resources, complete = self._load_resources(service, account_ids, regions)
+        # A partition or segment that failed would otherwise stay missing for CACHE_TTL
+        if complete:
+            self._cache_put(self._resource_cache, key, resources)
+        return list(resources)
+    
+    def _load_resources(
+        self,
+        service: str,
+        account_ids: Optional[List[str]],
+        regions: Optional[List[str]]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Query DynamoDB for get_resources; returns (resources, whether every read succeeded)"""
+        all_accounts = account_ids is None
+        
+        # Metadata records which account/region partitions hold data for this service.
+        # Most regions are empty for most accounts, so skip querying those partitions.
+        populated = self._get_populated_partitions(service)
         
         # Get all accounts if not specified
         if account_ids is None:
-            account_ids = self._get_all_accounts()
+            if populated is not None:
+                account_ids = sorted({account_id for account_id, _ in populated})
+            else:
+                account_ids = self._get_all_accounts()
         
         # Get all regions if not specified
         if regions is None:
-            regions = self._get_all_regions(service)
+            if populated is not None:
+                regions = sorted({region for _, region in populated})
+            else:
+                regions = self._get_all_regions(service)
+        
+        # One query per populated (account, region) partition
+        work = [
+            (account_id, region)
+            for account_id in account_ids
+            for region in regions
+            if populated is None or (account_id, region) in populated
+        ]
+        
+        if not work:
+            return [], True
+        if len(work) == 1:
+            return self._query_pk(service, *work[0])
+        if all_accounts and len(work) > self.SCAN_PARTITION_THRESHOLD:
+            return self._scan(service, self.SCAN_SEGMENTS, work)
+        
+        # Query partitions in parallel (I/O bound); map() keeps account/region order stable for pagination
+        all_resources = []
+        complete = True
+        with ThreadPoolExecutor(max_workers=min(self.MAX_QUERY_WORKERS, len(work))) as executor:
+            for partition_resources, partition_complete in executor.map(
+                lambda args: self._query_pk(service, *args),
+                work
+            ):
+                all_resources.extend(partition_resources)
+                complete = complete and partition_complete
+        
+        return all_resources, complete
+    
+    def get_resources_parallel(
+        self,
+        service: str,
+        segments: Optional[int] = None,
+        partitions: Optional[List[Tuple[str, str]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve resources of a service with a parallel scan
+        
+        Cheaper than per-partition queries once a read spans many account/region
+        partitions. Segments are read concurrently; results are returned in the same
+        account/region order as the query path so pagination doesn't change with it.
+        
+        Args:
+            service: Service name
+            segments: Number of scan segments (defaults to SCAN_SEGMENTS)
+            partitions: Optional (accountId, region) pairs to keep, in result order
+                        (defaults to every partition, sorted)
+            
+        Returns:
+            List of resource dictionaries
+        """
+        return self._scan(service, segments or self.SCAN_SEGMENTS, partitions)[0]
+    
+    def _scan(
+        self,
+        service: str,
+        segments: int,
+        partitions: Optional[List[Tuple[str, str]]]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """get_resources_parallel, also returning whether every segment was read in full"""
+        rows = []
+        complete = True
+        with ThreadPoolExecutor(max_workers=segments) as executor:
+            for segment_rows, segment_complete in executor.map(
+                lambda segment: self._scan_segment(service, segment, segments),
+                range(segments)
+            ):
+                rows.extend(segment_rows)
+                complete = complete and segment_complete
+        
+        # Order by partition (stable, so each partition keeps its scan order)
+        if partitions is None:
+            rows.sort(key=lambda row: row[0])
+        else:
+            order = {_pk(service, account_id, region): i for i, (account_id, region) in enumerate(partitions)}
+            rows = [row for row in rows if row[0] in order]
+            rows.sort(key=lambda row: order[row[0]])
+        return [resource for _, resource in rows], complete
+    
+    def _scan_segment(
+        self,
+        service: str,
+        segment: int,
+        total_segments: int
+    ) -> Tuple[List[Tuple[str, Dict[str, Any]]], bool]:
+        """Scan one segment for a service's (pk, resource) rows; False if the scan failed partway"""
+        rows = []
+        
+        try:
+            scan_kwargs = {
+                'Segment': segment,
+                'TotalSegments': total_segments,
+                'FilterExpression': 'service = :service',
+                'ProjectionExpression': 'pk, #data',
+                'ExpressionAttributeNames': {'#data': 'data'},
+                'ExpressionAttributeValues': {':service': service}
+            }
+            while True:
+                response = self.read_table.scan(**scan_kwargs)
+                for item in response.get('Items', []):
+                    rows.append((item['pk'], self._convert_from_dynamodb_item(item.get('data', {}))))
+                
+                if 'LastEvaluatedKey' not in response:
+                    return rows, True
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except Exception as e:
+            print(f"Error scanning DynamoDB segment {segment} for {service}: {str(e)}")
+            return rows, False
+    
+    def _query_pk(
+        self,
+        service: str,
+        account_id: str,
+        region: str
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Retrieve resources for a single service/account/region partition; False if the query failed partway"""
+        pk = _pk(service, account_id, region)
+        resources = []
         
-        # Query for each account/region combination
-        for account_id in account_ids:
-            for region in regions:
-                pk = f"{service}#{account_id}#{region}"
+        try:
+            query_kwargs = {
+                'KeyConditionExpression': 'pk = :pk',
+                'ExpressionAttributeValues': {':pk': pk}
+            }
+            while True:
+                response = self.read_table.query(**query_kwargs)
                 
-                try:
-                    response = self.table.query(
-                        KeyConditionExpression='pk = :pk',
-                        ExpressionAttributeValues={':pk': pk}
-                    )
-                    
-                    for item in response.get('Items', []):
-                        resource = self._convert_from_dynamodb_item(item.get('data', {}))
-                        # Ensure accountId and region are set
-                        resource['accountId'] = account_id
-                        resource['region'] = region
-                        all_resources.append(resource)
-                    
-                    # Handle pagination
-                    while 'LastEvaluatedKey' in response:
-                        response = self.table.query(
-                            KeyConditionExpression='pk = :pk',
-                            ExpressionAttributeValues={':pk': pk},
-                            ExclusiveStartKey=response['LastEvaluatedKey']
-                        )
-                        for item in response.get('Items', []):
-                            resource = self._convert_from_dynamodb_item(item.get('data', {}))
-                            resource['accountId'] = account_id
-                            resource['region'] = region
-                            all_resources.append(resource)
-                except Exception as e:
-                    print(f"Error querying DynamoDB for {service}#{account_id}#{region}: {str(e)}")
-                    continue
+                # Collectors stamp accountId and region on every resource before it is stored
+                for item in response.get('Items', []):
+                    resources.append(self._convert_from_dynamodb_item(item.get('data', {})))
+                
+                if 'LastEvaluatedKey' not in response:
+                    return resources, True
+                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except Exception as e:
+            print(f"Error querying DynamoDB for {pk}: {str(e)}")
+            return resources, False
+    
+    def _get_populated_partitions(self, service: str) -> Optional[Set[Tuple[str, str]]]:
+        """
+        Get (accountId, region) pairs that hold resources for a service
         
-        return all_resources
+        Returns:
+            Set of pairs from the metadata table, or None if metadata can't be read
+        """
+        try:
+            query_kwargs = {
+                'KeyConditionExpression': 'service = :service',
+                'ExpressionAttributeValues': {':service': service},
+                'ProjectionExpression': 'accountRegion, resourceCount'
+            }
+            partitions = set()
+            while True:
+                response = self.metadata_table.query(**query_kwargs)
+                for item in response.get('Items', []):
+                    if item.get('resourceCount', 0) > 0 and '#' in item.get('accountRegion', ''):
+                        account_id, region = item['accountRegion'].split('#', 1)
+                        partitions.add((account_id, region))
+                
+                if 'LastEvaluatedKey' not in response:
+                    return partitions
+                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except Exception as e:
+            print(f"Error getting populated partitions from metadata: {str(e)}")
+            return None
     
     def _get_all_accounts(self) -> List[str]:
         """Get all unique account IDs from metadata"""
@@ -263,30 +695,25 @@ class DynamoDBStorage:
             print(f"Error getting regions from metadata: {str(e)}")
             return ['us-east-1']
     
-    def _update_metadata(
+    def _metadata_item(
         self,
         service: str,
         account_id: str,
         region: str,
         timestamp: str,
         resource_count: int
-    ) -> None:
-        """Update metadata table with last update information"""
-        try:
-            # Use composite sort key: accountId#region
-            account_region = f"{account_id}#{region}"
-            self.metadata_table.put_item(
-                Item={
-                    'service': service,
-                    'accountRegion': account_region,
-                    'accountId': account_id,
-                    'region': region,
-                    'updatedAt': timestamp,
-                    'resourceCount': resource_count
-                }
-            )
-        except Exception as e:
-            print(f"Error updating metadata: {str(e)}")
+    ) -> Dict[str, Any]:
+        """Build the metadata table row with last update information"""
+        # Use composite sort key: accountId#region
+        account_region = f"{account_id}#{region}"
+        return {
+            'service': service,
+            'accountRegion': account_region,
+            'accountId': account_id,
+            'region': region,
+            'updatedAt': timestamp,
+            'resourceCount': resource_count
+        }
     
     def get_last_update_time(self, service: Optional[str] = None) -> Optional[datetime]:
         """
@@ -298,55 +725,63 @@ class DynamoDBStorage:
         Returns:
             Last update datetime or None
         """
-        try:
-            if service:
+        hit, cached = self._cache_get(self._update_time_cache, service)
+        if hit:
+            return cached
+        
+        latest_timestamp = self._load_last_update_time(service)
+        if latest_timestamp is not None:
+            self._cache_put(self._update_time_cache, service, latest_timestamp)
+        return latest_timestamp
+    
+    def _load_last_update_time(self, service: Optional[str]) -> Optional[datetime]:
+        """Read the metadata table for get_last_update_time"""
+        if service:
+            # The index keeps each service's rows sorted by updatedAt, so the newest is one read
+            try:
                 response = self.metadata_table.query(
+                    IndexName=self.METADATA_UPDATED_INDEX,
                     KeyConditionExpression='service = :service',
                     ExpressionAttributeValues={':service': service},
-                    ProjectionExpression='updatedAt'
+                    ProjectionExpression='updatedAt',
+                    ScanIndexForward=False,
+                    Limit=1
                 )
+                items = response.get('Items', [])
+                return datetime.fromisoformat(items[0]['updatedAt']) if items else None
+            except Exception as e:
+                # e.g. the index isn't deployed yet - fall back to reading every row
+                print(f"Error querying {self.METADATA_UPDATED_INDEX}, reading all metadata rows: {str(e)}")
+        
+        try:
+            if service:
+                read = self.metadata_table.query
+                read_kwargs = {
+                    'KeyConditionExpression': 'service = :service',
+                    'ExpressionAttributeValues': {':service': service},
+                    'ProjectionExpression': 'updatedAt'
+                }
             else:
-                response = self.metadata_table.scan(
-                    ProjectionExpression='updatedAt'
-                )
-            
-            latest_timestamp = None
-            for item in response.get('Items', []):
-                updated_at = item.get('updatedAt')
-                if updated_at:
-                    try:
-                        timestamp = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                        if latest_timestamp is None or timestamp > latest_timestamp:
-                            latest_timestamp = timestamp
-                    except Exception:
-                        continue
+                read = self.metadata_table.scan
+                read_kwargs = {'ProjectionExpression': 'updatedAt'}
             
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
-                if service:
-                    response = self.metadata_table.query(
-                        KeyConditionExpression='service = :service',
-                        ExpressionAttributeValues={':service': service},
-                        ProjectionExpression='updatedAt',
-                        ExclusiveStartKey=response['LastEvaluatedKey']
-                    )
-                else:
-                    response = self.metadata_table.scan(
-                        ProjectionExpression='updatedAt',
-                        ExclusiveStartKey=response['LastEvaluatedKey']
-                    )
+            # updatedAt is always written as a UTC isoformat() string, so the newest
+            # timestamp is also the largest string - only the winner gets parsed
+            latest = None
+            while True:
+                response = read(**read_kwargs)
+                page_latest = max(
+                    (item['updatedAt'] for item in response.get('Items', []) if item.get('updatedAt')),
+                    default=None
+                )
+                if page_latest and (latest is None or page_latest > latest):
+                    latest = page_latest
                 
-                for item in response.get('Items', []):
-                    updated_at = item.get('updatedAt')
-                    if updated_at:
-                        try:
-                            timestamp = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                            if latest_timestamp is None or timestamp > latest_timestamp:
-                                latest_timestamp = timestamp
-                        except Exception:
-                            continue
+                if 'LastEvaluatedKey' not in response:
+                    break
+                read_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
             
-            return latest_timestamp
+            return datetime.fromisoformat(latest) if latest else None
         except Exception as e:
             print(f"Error getting last update time: {str(e)}")
             return None
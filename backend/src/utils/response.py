@@ -7,8 +7,19 @@ Python 3.12+ compatible, forward-compatible with Python 3.14+
 from __future__ import annotations  # PEP 563 - Deferred evaluation of annotations
 
 import json
+import os
+from decimal import Decimal
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library when orjson isn't installed (e.g. local runs)
+    orjson = None
+
+
+# Debug information is only returned outside production (resolved once per container)
+_IS_DEV = os.environ.get("ENVIRONMENT") not in ("prod", "production")
 
 CORS_HEADERS = {
     "Access-Control-Allow-Origin": "*",
@@ -18,20 +29,40 @@ CORS_HEADERS = {
 }
 
 
+def _merge_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """CORS headers plus any extra headers; the shared dict is returned as-is when there are none"""
+    if not headers:
+        # Responses only read their headers, so the module constant can be shared
+        return CORS_HEADERS
+    return {**CORS_HEADERS, **headers}
+
+
+def _default(value: Any) -> Any:
+    """Serialize values JSON doesn't support: Decimal as a number, anything else as a string"""
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a response body to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=_default)
+
+
 def success_response(
     data: Any,
     status_code: int = 200,
     headers: Optional[Dict[str, str]] = None
 ) -> Dict[str, Any]:
     """Create success response"""
-    response_headers = {**CORS_HEADERS}
-    if headers:
-        response_headers.update(headers)
+    response_headers = _merge_headers(headers)
     
     return {
         "statusCode": status_code,
         "headers": response_headers,
-        "body": json.dumps(data, default=str)
+        "body": _dumps(data)
     }
 
 
@@ -48,13 +79,11 @@ def error_response(
     Args:
         message: User-friendly error message
         status_code: HTTP status code
-        details: Additional error details (for debugging)
+        details: Additional error details (for debugging, omitted in production)
         headers: Additional headers
         error_code: Machine-readable error code
     """
-    response_headers = {**CORS_HEADERS}
-    if headers:
-        response_headers.update(headers)
+    response_headers = _merge_headers(headers)
     
     body: Dict[str, Any] = {
         "error": message,
@@ -64,18 +93,14 @@ def error_response(
     if error_code:
         body["code"] = error_code
     
-    if details:
-        body["details"] = details
-    
     # Only include details in development/staging
-    import os
-    if os.environ.get("ENVIRONMENT") not in ["prod", "production"]:
-        body["debug"] = details
+    if details and _IS_DEV:
+        body["details"] = details
     
     return {
         "statusCode": status_code,
         "headers": response_headers,
-        "body": json.dumps(body)
+        "body": _dumps(body)
     }
 
 
@@ -0,0 +1,170 @@
+"""
+Tests for DynamoDB storage read paths (run from backend/: python -m pytest)
+"""
+
+import os
+import sys
+import unittest
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.dynamodb_storage import DynamoDBStorage  # noqa: E402
+
+
+class FakeMetadataTable:
+    """Metadata table holding one populated row per (account, region) partition"""
+    
+    def __init__(self, partitions):
+        self.partitions = partitions
+    
+    def query(self, **kwargs):
+        return {'Items': [
+            {'accountRegion': f"{account_id}#{region}", 'resourceCount': 1}
+            for account_id, region in self.partitions
+        ]}
+
+
+class FakeInventoryTable:
+    """Inventory table with one row per partition, served by query or by a segmented scan"""
+    
+    def __init__(self, service, partitions, fail_pks=()):
+        self.rows = [
+            {'pk': f"{service}#{account_id}#{region}", 'service': service,
+             'data': {'id': f"{account_id}-{region}", 'accountId': account_id, 'region': region}}
+            for account_id, region in partitions
+        ]
+        self.fail_pks = set(fail_pks)
+        self.queries = 0
+        self.scans = 0
+    
+    def query(self, **kwargs):
+        self.queries += 1
+        pk = kwargs['ExpressionAttributeValues'][':pk']
+        if pk in self.fail_pks:
+            raise RuntimeError('throttled')
+        return {'Items': [row for row in self.rows if row['pk'] == pk]}
+    
+    def scan(self, **kwargs):
+        self.scans += 1
+        # Reverse so segment order doesn't match partition order
+        segment_rows = self.rows[kwargs['Segment']::kwargs['TotalSegments']]
+        return {'Items': list(reversed(segment_rows))}
+
+
+def make_storage(service, partitions, fail_pks=()):
+    storage = DynamoDBStorage()
+    storage.table = storage.read_table = FakeInventoryTable(service, partitions, fail_pks)
+    storage.metadata_table = FakeMetadataTable(partitions)
+    return storage
+
+
+class TestGetResources(unittest.TestCase):
+    PARTITIONS = [
+        ('111', 'eu-west-1'), ('111', 'us-east-1'),
+        ('222', 'eu-west-1'), ('222', 'us-east-1'),
+    ]
+    
+    def test_large_read_across_accounts_uses_scan_in_query_order(self):
+        storage = make_storage('ec2', self.PARTITIONS)
+        storage.SCAN_PARTITION_THRESHOLD = 2
+        
+        resources = storage.get_resources('ec2', regions=['us-east-1', 'eu-west-1'])
+        
+        self.assertEqual(storage.read_table.queries, 0)
+        self.assertEqual(storage.read_table.scans, storage.SCAN_SEGMENTS)
+        self.assertEqual(
+            [r['id'] for r in resources],
+            ['111-us-east-1', '111-eu-west-1', '222-us-east-1', '222-eu-west-1']
+        )
+    
+    def test_scan_keeps_only_requested_regions(self):
+        storage = make_storage('ec2', self.PARTITIONS)
+        storage.SCAN_PARTITION_THRESHOLD = 1
+        
+        resources = storage.get_resources('ec2', regions=['eu-west-1'])
+        
+        self.assertEqual(storage.read_table.scans, storage.SCAN_SEGMENTS)
+        self.assertEqual([r['id'] for r in resources], ['111-eu-west-1', '222-eu-west-1'])
+    
+    def test_scan_and_query_paths_return_the_same_order(self):
+        scanned = make_storage('ec2', self.PARTITIONS)
+        scanned.SCAN_PARTITION_THRESHOLD = 1
+        queried = make_storage('ec2', self.PARTITIONS)
+        
+        self.assertEqual(scanned.get_resources('ec2'), queried.get_resources('ec2'))
+        self.assertEqual(queried.read_table.scans, 0)
+    
+    def test_account_filtered_read_uses_queries(self):
+        storage = make_storage('ec2', self.PARTITIONS)
+        storage.SCAN_PARTITION_THRESHOLD = 1
+        
+        resources = storage.get_resources('ec2', account_ids=['111'])
+        
+        self.assertEqual(storage.read_table.scans, 0)
+        self.assertEqual([r['id'] for r in resources], ['111-eu-west-1', '111-us-east-1'])
+
+
+class TestResourceCache(unittest.TestCase):
+    PARTITIONS = [('111', 'us-east-1'), ('222', 'us-east-1')]
+    
+    def test_complete_reads_are_cached(self):
+        storage = make_storage('ec2', self.PARTITIONS)
+        storage.CACHE_TTL = 60
+        
+        first = storage.get_resources('ec2')
+        queries = storage.read_table.queries
+        
+        self.assertEqual(storage.get_resources('ec2'), first)
+        self.assertEqual(storage.read_table.queries, queries)
+    
+    def test_partial_reads_are_not_cached(self):
+        storage = make_storage('ec2', self.PARTITIONS, fail_pks={'ec2#222#us-east-1'})
+        storage.CACHE_TTL = 60
+        
+        self.assertEqual([r['id'] for r in storage.get_resources('ec2')], ['111-us-east-1'])
+        
+        storage.read_table.fail_pks.clear()
+        self.assertEqual(
+            [r['id'] for r in storage.get_resources('ec2')],
+            ['111-us-east-1', '222-us-east-1']
+        )
+
+
+
+class TestStoreResourcesBulk(unittest.TestCase):
+    def make_storage(self, fail_metadata=False):
+        storage = DynamoDBStorage()
+        storage.writes = []
+        
+        def write_parallel(requests, table_name=None):
+            if fail_metadata and table_name == storage.metadata_table_name:
+                raise RuntimeError('throttled')
+            storage.writes.append((table_name, requests))
+        
+        storage._write_parallel = write_parallel
+        storage._stale_keys = lambda *args: []
+        return storage
+    
+    def test_writes_only_its_own_metadata_rows(self):
+        storage = self.make_storage()
+        
+        storage.store_resources_bulk('ec2', '111', {'us-east-1': [{'id': 'i-1'}], 'eu-west-1': []})
+        storage.store_resources_bulk('ec2', '222', {'us-east-1': [{'id': 'i-2'}]})
+        
+        metadata_writes = [
+            [request['PutRequest']['Item']['accountRegion'] for request in requests]
+            for table_name, requests in storage.writes
+            if table_name == storage.metadata_table_name
+        ]
+        self.assertEqual(metadata_writes, [['111#us-east-1', '111#eu-west-1'], ['222#us-east-1']])
+    
+    def test_metadata_write_failure_raises(self):
+        storage = self.make_storage(fail_metadata=True)
+        
+        with self.assertRaises(RuntimeError):
+            storage.store_resources_bulk('ec2', '111', {'us-east-1': [{'id': 'i-1'}]})
+
+
+if __name__ == '__main__':
+    unittest.main()